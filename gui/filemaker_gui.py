@@ -17,7 +17,7 @@ import queue
 import time
 
 # Import our modules
-from gui_logging import LogManager, LogLevel, PerformanceLogger
+from gui_logging import LogManager, LogLevel, PerformanceLogger, ERROR_LEVELS
 from gui_widgets import StatusCard, MigrationOverview, QuickActions, StatusBar
 from gui_operations import OperationManager, ConnectionTester, StatusManager
 from gui_logviewer import LogViewerWindow, LogStatsWindow
@@ -53,6 +53,11 @@ class FileMakerSyncGUI:
         self._auto_refresh_timer = None
         self._auto_refresh_interval = 30000  # 30 seconds
         
+        # Set when something may have changed the health indicator; starts set to force the first paint
+        self._status_dirty = threading.Event()
+        self._status_dirty.set()
+        self._last_error_count = 0  # Recent errors behind the current health indicator
+        
         # Initialize GUI
         self.create_widgets()
         self.setup_bindings()
@@ -179,8 +184,8 @@ class FileMakerSyncGUI:
         title_label.pack(side='left')
         
         subtitle_text = "Monitor and manage your FileMaker to Supabase migration"
-        if self.config.get('debug', {}).get('debug_mode', False):
-            log_level = self.config.get('debug', {}).get('log_level', 'INFO')
+        if self.log_manager.debug_mode:
+            log_level = self.log_manager.log_level
             # Removed debug info from subtitle for cleaner look
         
         subtitle_label = ttk.Label(header_frame, text=subtitle_text, font=('Arial', 9))
@@ -286,18 +291,25 @@ class FileMakerSyncGUI:
     def setup_callbacks(self):
         """Set up callbacks for real-time updates with thread safety"""
         # Log manager callbacks
-        self.log_manager.add_callback(self.on_new_log_entry_safe)
+        self.log_manager.add_batch_callback(self.on_new_log_entries_safe)
         
         # Operation manager callbacks
         self.operation_manager.add_operation_callback(self.on_operation_status_safe)
     
-    def on_new_log_entry_safe(self, log_entry):
-        """Thread-safe handler for new log entries"""
-        if log_entry.level in ['ERROR', 'CRITICAL']:
+    def on_new_log_entries_safe(self, log_entries):
+        """Thread-safe handler for batches of new log entries"""
+        if any(entry.level in ERROR_LEVELS for entry in log_entries):
+            self._status_dirty.set()
             self.schedule_gui_update(self.update_status_indicator)
+        elif self._last_error_count:
+            # Newer entries may have pushed the errors out of the recent window - recheck on the next poll
+            self._status_dirty.set()
     
     def on_operation_status_safe(self, status, operation, result=None):
         """Thread-safe handler for operation status updates"""
+        if status in ('start', 'complete'):
+            self._status_dirty.set()
+        
         def update_operation_ui():
             try:
                 if status == 'start':
@@ -378,6 +390,8 @@ class FileMakerSyncGUI:
     
     def on_connection_test_complete_safe(self, connection_type, status):
         """Thread-safe connection test completion handler"""
+        self._status_dirty.set()
+        
         def update_connection_ui():
             try:
                 if connection_type == 'filemaker':
@@ -484,8 +498,8 @@ class FileMakerSyncGUI:
         """Update the overall status indicator"""
         try:
             # Count recent errors
-            recent_logs = self.log_manager.get_recent_logs(limit=100)
-            error_count = len([log for log in recent_logs if log.level in ['ERROR', 'CRITICAL']])
+            error_count = self.log_manager.count_recent_levels(ERROR_LEVELS, limit=100)
+            self._last_error_count = error_count
             
             self.status_bar.update_health(error_count)
         except Exception as e:
@@ -758,8 +772,9 @@ Enhanced with comprehensive thread safety and user controls.
         def auto_refresh():
             try:
                 if not self._shutdown_requested.is_set():
-                    # Only refresh if not currently running an operation
-                    if not self.operation_manager.is_operation_running:
+                    # Only refresh if not currently running an operation and something changed
+                    if not self.operation_manager.is_operation_running and self._status_dirty.is_set():
+                        self._status_dirty.clear()
                         self.update_status_indicator()
                     
                     # Schedule next refresh
@@ -808,18 +823,36 @@ Enhanced with comprehensive thread safety and user controls.
             # Shutdown operation manager
             self.operation_manager.shutdown()
             
-            # Close all child windows
+            # Close all child windows - snapshot under the lock, tear down outside it
             with self._child_windows_lock:
-                for window_name, window_obj in list(self.child_windows.items()):
-                    try:
-                        window_obj.close_window()
-                    except:
-                        pass
+                windows = list(self.child_windows.values())
                 self.child_windows.clear()
+
+            # Hide every child first so the display is cleared in one pass
+            for window_obj in windows:
+                try:
+                    toplevel = getattr(window_obj, 'window', None)
+                    if toplevel is not None:
+                        toplevel.withdraw()
+                except:
+                    pass
+
+            # Single idle-task flush, then destroy each child
+            try:
+                self.root.update_idletasks()
+            except:
+                pass
+
+            for window_obj in windows:
+                try:
+                    window_obj.close_window()
+                except:
+                    pass
             
-            # Remove callbacks
+            # Remove callbacks and drain the background log writer
             try:
-                self.log_manager.remove_callback(self.on_new_log_entry_safe)
+                self.log_manager.remove_batch_callback(self.on_new_log_entries_safe)
+                self.log_manager.shutdown()
             except:
                 pass
             
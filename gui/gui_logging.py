@@ -5,16 +5,29 @@ GUI Logging Module
 """
 
 import logging
+import logging.handlers
 import json
 import sys
 import os
+import re
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, Any, Optional, List, Callable
-from dataclasses import dataclass, asdict
+from typing import Dict, Any, Optional, List, Callable, Tuple
+from dataclasses import dataclass
 from enum import Enum
 import threading
 import queue
+import time
+import atexit
+import weakref
+from collections import deque, Counter
+from itertools import islice
+from contextlib import nullcontext
+
+try:
+    import orjson  # Optional - faster JSON for details and exports
+except ImportError:
+    orjson = None
 
 class LogLevel(Enum):
     DEBUG = "DEBUG"
@@ -23,14 +36,118 @@ class LogLevel(Enum):
     ERROR = "ERROR"
     CRITICAL = "CRITICAL"
 
-@dataclass
+def _noop(*args, **kwargs):
+    """Stand-in for debug-only helpers when debug mode is off"""
+    return None
+
+# Shared do-nothing context manager handed out instead of PerformanceLogger when debug mode is off
+_NULL_PERFORMANCE_LOGGER = nullcontext()
+
+# Numeric severity for each level name, matching the stdlib logging values
+LEVEL_VALUES = {
+    'DEBUG': 10,
+    'INFO': 20,
+    'WARNING': 30,
+    'ERROR': 40,
+    'CRITICAL': 50
+}
+
+# Attach the numeric value to each member so log() can filter with a single int compare
+for _member in LogLevel:
+    _member.num = LEVEL_VALUES[_member.value]
+del _member
+
+# Levels counted as errors by the trackers and status indicators
+ERROR_LEVELS = frozenset({'ERROR', 'CRITICAL'})
+
+# slots=True needs Python 3.10+; fall back to a regular dataclass on 3.9
+_ENTRY_DATACLASS_OPTIONS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+# Records the background writer may fall behind by before producers block
+LOG_QUEUE_SIZE = 10000
+
+# Most entries handed to batch callbacks in one call; smaller batches go out as soon as the writer is idle
+CALLBACK_BATCH_SIZE = 64
+
+# Log file write buffer and how often buffered lines are pushed to disk
+LOG_FILE_BUFFER_SIZE = 8192
+LOG_FLUSH_INTERVAL = 1.0  # seconds
+
+# Number of rotated daily log files to keep
+LOG_BACKUP_DAYS = 14
+
+# Write buffer for text log exports
+EXPORT_BUFFER_SIZE = 64 * 1024
+
+# Upper bound on serialized details written alongside a log line
+MAX_DETAILS_LENGTH = 2048
+
+# Level keywords for subprocess output, checked in priority order (first pattern that matches wins)
+_SUBPROCESS_LEVEL_PATTERNS = (
+    (re.compile(r'error|failed|exception', re.IGNORECASE), LogLevel.ERROR),
+    (re.compile(r'warn', re.IGNORECASE), LogLevel.WARNING),
+    (re.compile(r'debug', re.IGNORECASE), LogLevel.DEBUG),
+)
+
+# Logger prefixes the sync scripts put in front of their own output
+_SUBPROCESS_PREFIX_RE = re.compile(r'(?:INFO|DEBUG|WARNING|ERROR):FileMakerSync:\s*')
+
+def _weak_callback(callback: Callable) -> weakref.ref:
+    """Weak reference to a callback; bound methods need WeakMethod to stay alive with their object"""
+    if hasattr(callback, '__self__'):
+        return weakref.WeakMethod(callback)
+    return weakref.ref(callback)
+
+def _format_details(details: Dict, max_length: Optional[int] = MAX_DETAILS_LENGTH) -> str:
+    """Serialize log details compactly, capped at max_length characters (None for no cap)"""
+    if orjson is not None:
+        text = orjson.dumps(details, default=repr, option=orjson.OPT_NON_STR_KEYS).decode('utf-8')
+    else:
+        text = json.dumps(details, separators=(',', ':'), default=repr)
+    if max_length is None or len(text) <= max_length:
+        return text
+    return text[:max_length] + f"...({len(text) - max_length} chars truncated)"
+
+# (second, 'YYYY-MM-DDTHH:MM:SS') for the most recently formatted timestamp
+_iso_second_cache = (None, '')
+
+def _format_iso_timestamp(created: float) -> str:
+    """Same output as datetime.fromtimestamp(created).isoformat(), reusing the per-second prefix"""
+    global _iso_second_cache
+    second = int(created)
+    usec = round((created - second) * 1_000_000)
+    if usec >= 1_000_000:
+        second, usec = second + 1, usec - 1_000_000
+    cached_second, prefix = _iso_second_cache
+    if second != cached_second:
+        prefix = time.strftime('%Y-%m-%dT%H:%M:%S', time.localtime(second))
+        _iso_second_cache = (second, prefix)
+    return f"{prefix}.{usec:06d}" if usec else prefix
+
+@dataclass(frozen=True, **_ENTRY_DATACLASS_OPTIONS)
 class LogEntry:
-    timestamp: str
+    created: float  # seconds since the epoch, as recorded by logging
     level: str
     component: str
     message: str
     details: Optional[Dict] = None
     session_id: Optional[str] = None
+    
+    @property
+    def timestamp(self) -> str:
+        """ISO-8601 timestamp, formatted only when something asks for it"""
+        return _format_iso_timestamp(self.created)
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Serializable form used for exports"""
+        return {
+            'timestamp': self.timestamp,
+            'level': self.level,
+            'component': self.component,
+            'message': self.message,
+            'details': self.details,
+            'session_id': self.session_id
+        }
 
 class LogCaptureHandler(logging.Handler):
     """Custom logging handler that captures logs for the GUI"""
@@ -41,11 +158,18 @@ class LogCaptureHandler(logging.Handler):
         
     def emit(self, record):
         try:
+            # Drop records below the GUI level before paying for getMessage()
+            if record.levelno < self.log_manager._level_value:
+                self.log_manager._release_pending_batch()
+                return
+            
             # Convert logging record to our LogEntry format
+            # Level and component come from tiny sets, intern them so
+            # entries share the same string objects
             entry = LogEntry(
-                timestamp=datetime.fromtimestamp(record.created).isoformat(),
-                level=record.levelname,
-                component=record.name,
+                created=record.created,
+                level=sys.intern(record.levelname),
+                component=sys.intern(record.name),
                 message=record.getMessage(),
                 details=getattr(record, 'details', None),
                 session_id=self.log_manager.session_id
@@ -58,6 +182,120 @@ class LogCaptureHandler(logging.Handler):
             # Avoid recursion - don't log errors from the log handler
             pass
 
+class LogQueueHandler(logging.handlers.QueueHandler):
+    """Queue handler that applies back-pressure instead of dropping records when the writer falls behind"""
+    
+    def __init__(self, log_queue: queue.Queue):
+        super().__init__(log_queue)
+        self.listener: Optional[logging.handlers.QueueListener] = None
+    
+    def prepare(self, record):
+        """Merge the message arguments in place.
+        
+        The listener lives in this process, so the record does not need to be
+        copied or made picklable. Exception info stays attached and is formatted
+        by the file handler on the writer thread.
+        """
+        record.message = record.getMessage()
+        record.msg = record.message
+        record.args = None
+        return record
+    
+    def enqueue(self, record):
+        writer_thread = self.listener._thread if self.listener else None
+        if writer_thread is not None and threading.current_thread() is writer_thread:
+            # Records raised by the writer itself (e.g. callback errors) must never wait on the writer
+            self.queue.put_nowait(record)
+        else:
+            self.queue.put(record)
+
+class BufferedFileHandler(logging.handlers.TimedRotatingFileHandler):
+    """Daily-rotating file handler that buffers writes and flushes on a fixed interval instead of after every record"""
+    
+    def __init__(self, filename, encoding: str = 'utf-8', backup_count: int = LOG_BACKUP_DAYS,
+                 buffer_size: int = LOG_FILE_BUFFER_SIZE, flush_interval: float = LOG_FLUSH_INTERVAL):
+        self.buffer_size = buffer_size
+        self.flush_interval = flush_interval
+        super().__init__(filename, when='midnight', backupCount=backup_count,
+                         encoding=encoding, delay=True)
+        
+        self._stop_flusher = threading.Event()
+        self._flusher = threading.Thread(target=self._flush_periodically, daemon=True, name="LogFileFlusher")
+        self._flusher.start()
+    
+    def _open(self):
+        return open(self.baseFilename, self.mode, buffering=self.buffer_size,
+                    encoding=self.encoding, errors=self.errors)
+    
+    def emit(self, record):
+        """Write the record into the file buffer without flushing"""
+        try:
+            if self.shouldRollover(record):
+                self.doRollover()
+        except Exception:
+            self.handleError(record)
+            return
+        if self.stream is None:
+            if self.mode != 'w' or not getattr(self, '_closed', False):
+                self.stream = self._open()
+        if self.stream:
+            try:
+                self.stream.write(self.format(record) + self.terminator)
+            except RecursionError:
+                raise
+            except Exception:
+                self.handleError(record)
+    
+    def _flush_periodically(self):
+        while not self._stop_flusher.wait(self.flush_interval):
+            self.flush()
+    
+    def close(self):
+        self._stop_flusher.set()
+        super().close()
+
+class CachedTimeFormatter(logging.Formatter):
+    """Formatter that re-runs strftime only when the record's second changes"""
+    
+    def __init__(self, fmt: str = None, datefmt: str = None):
+        super().__init__(fmt, datefmt)
+        self._cached_second = None
+        self._cached_asctime = ''
+    
+    def formatTime(self, record, datefmt=None):
+        if datefmt is None:
+            return super().formatTime(record, datefmt)
+        
+        second = int(record.created)
+        if second != self._cached_second:
+            self._cached_second = second
+            self._cached_asctime = time.strftime(datefmt, self.converter(record.created))
+        return self._cached_asctime
+
+class FastFileFormatter(CachedTimeFormatter):
+    """Log file formatter that builds each line directly instead of going through %-style templates.
+    
+    Produces the same output as
+    '%(asctime)s,%(msecs)03d %(levelname)-8s [%(name)s:%(lineno)d] %(message)s'
+    using the cached per-second timestamp.
+    """
+    
+    def __init__(self, datefmt: str = '%Y-%m-%d:%H:%M:%S'):
+        super().__init__(datefmt=datefmt)
+    
+    def format(self, record):
+        asctime = self.formatTime(record, self.datefmt)
+        line = (f"{asctime},{int(record.msecs):03d} {record.levelname:<8} "
+                f"[{record.name}:{record.lineno}] {record.getMessage()}")
+        
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            line = f"{line}\n{record.exc_text}"
+        if record.stack_info:
+            line = f"{line}\n{self.formatStack(record.stack_info)}"
+        return line
+
 class LogManager:
     """Enhanced logging manager with proper GUI integration"""
     
@@ -70,31 +308,53 @@ class LogManager:
         debug_config = self.config.get('debug', {})
         
         self.log_level = debug_config.get('log_level', 'INFO')
+        self._level_value = LEVEL_VALUES.get(self.log_level, 20)
         self.console_logging = debug_config.get('console_logging', False)
         self.max_memory_logs = debug_config.get('max_log_entries', 1000)
         self.debug_mode = debug_config.get('debug_mode', False)
+        self._verbose_sql = debug_config.get('verbose_sql', False)
+        self._debug_connections = debug_config.get('debug_connections', False)
         
-        # Memory storage for recent logs with thread safety
-        self.memory_logs: List[LogEntry] = []
+        # Debug-only helpers are bound once; with debug mode off they cost a single no-op call
+        self.log_function_call = self._log_function_call if self.debug_mode else _noop
+        
+        # Memory storage for recent logs with thread safety (ring buffer - oldest entries drop off)
+        self.memory_logs: deque = deque(maxlen=self.max_memory_logs)
         self._log_lock = threading.Lock()
         
+        # Per-level and per-component views of memory_logs (oldest first), kept in step with
+        # appends and evictions; their lengths double as the level/component histograms
+        self._by_level: Dict[str, deque] = {}
+        self._by_component: Dict[str, deque] = {}
+        
+        # Number of entries ever appended - lets viewers fetch just what is new
+        self._sequence = 0
+        
         # Session ID for tracking
         self.session_id = datetime.now().strftime("%Y%m%d_%H%M%S")
         
-        # Event callbacks with thread safety
-        self.log_callbacks: List[Callable[[LogEntry], None]] = []
+        # Event callbacks with thread safety, held weakly so destroyed widgets do not linger
+        self.log_callbacks: List[weakref.ref] = []
+        self.batch_callbacks: List[weakref.ref] = []
         self._callback_lock = threading.Lock()
+        self._pending_batch: List[LogEntry] = []
+        
+        # Console handler owned by this manager (None while console logging is off)
+        self._console_handler: Optional[logging.Handler] = None
         
         # Set up comprehensive logging
         self.setup_logging_system()
         
+        # Make sure queued records reach the file on interpreter exit
+        atexit.register(self.shutdown)
+        
         # Log startup info
         self.log(LogLevel.INFO, "LogManager", f"Logging initialized - Level: {self.log_level}, Console: {self.console_logging}, Debug: {self.debug_mode}")
     
     def setup_logging_system(self):
         """Set up comprehensive logging system that captures all logs"""
-        # Create log file
-        log_file = self.log_dir / f"filemaker_sync_{datetime.now().strftime('%Y%m%d')}.log"
+        # Create log file (rotated at midnight; previous days keep a date suffix)
+        log_file = self.log_dir / "filemaker_sync.log"
         
         # Get numeric log level
         numeric_level = getattr(logging, self.log_level.upper(), logging.INFO)
@@ -103,38 +363,53 @@ class LogManager:
         root_logger = logging.getLogger()
         root_logger.setLevel(logging.DEBUG)  # Always capture debug at root level
         
-        # Clear existing handlers
-        for handler in root_logger.handlers[:]:
-            root_logger.removeHandler(handler)
+        # Clear existing handlers, keeping an already-open handler for the
+        # log file so re-instantiating the manager does not reopen it
+        file_handler = None
+        for handler in self._release_root_handlers(root_logger):
+            if (file_handler is None and isinstance(handler, logging.FileHandler)
+                    and handler.baseFilename == os.path.abspath(log_file)):
+                file_handler = handler
+            else:
+                handler.close()
         
         # Create formatters
-        file_formatter = logging.Formatter(
-            '%(asctime)s,%(msecs)03d %(levelname)-8s [%(name)s:%(lineno)d] %(message)s',
-            '%Y-%m-%d:%H:%M:%S'
-        )
+        file_formatter = FastFileFormatter('%Y-%m-%d:%H:%M:%S')
         
-        console_formatter = logging.Formatter(
+        console_formatter = CachedTimeFormatter(
             '%(asctime)s %(levelname)-8s [%(name)s] %(message)s',
             '%H:%M:%S'
         )
         
         # File handler - always enabled
-        file_handler = logging.FileHandler(log_file, encoding='utf-8')
+        if file_handler is None:
+            file_handler = BufferedFileHandler(log_file, encoding='utf-8')
         file_handler.setLevel(logging.DEBUG)  # Capture everything to file
         file_handler.setFormatter(file_formatter)
-        root_logger.addHandler(file_handler)
         
         # Console handler - conditional
+        self._console_handler = None
         if self.console_logging:
-            console_handler = logging.StreamHandler(sys.stdout)
-            console_handler.setLevel(numeric_level)
-            console_handler.setFormatter(console_formatter)
-            root_logger.addHandler(console_handler)
+            self._console_handler = logging.StreamHandler(sys.stdout)
+            self._console_handler.setLevel(numeric_level)
+            self._console_handler.setFormatter(console_formatter)
+            root_logger.addHandler(self._console_handler)
         
         # GUI capture handler - captures for memory storage
         gui_handler = LogCaptureHandler(self)
         gui_handler.setLevel(logging.DEBUG)  # Capture everything for GUI
-        root_logger.addHandler(gui_handler)
+        
+        # File writes, memory capture and callbacks run on a single background
+        # writer thread; producers only pay for an enqueue
+        self._log_queue = queue.Queue(maxsize=LOG_QUEUE_SIZE)
+        self._queue_handler = LogQueueHandler(self._log_queue)
+        self._queue_handler.setLevel(logging.DEBUG)
+        self._listener = logging.handlers.QueueListener(
+            self._log_queue, file_handler, gui_handler, respect_handler_level=True
+        )
+        self._queue_handler.listener = self._listener
+        root_logger.addHandler(self._queue_handler)
+        self._listener.start()
         
         # Set specific logger levels based on configuration
         app_logger = logging.getLogger('FileMakerSync')
@@ -142,12 +417,12 @@ class LogManager:
         
         # Configure third-party loggers
         if self.debug_mode:
-            if self.config.get('debug', {}).get('verbose_sql', False):
+            if self._verbose_sql:
                 logging.getLogger('sqlalchemy.engine').setLevel(logging.INFO)
             else:
                 logging.getLogger('sqlalchemy.engine').setLevel(logging.WARNING)
                 
-            if self.config.get('debug', {}).get('debug_connections', False):
+            if self._debug_connections:
                 logging.getLogger('urllib3.connectionpool').setLevel(logging.DEBUG)
             else:
                 logging.getLogger('urllib3.connectionpool').setLevel(logging.WARNING)
@@ -158,78 +433,208 @@ class LogManager:
             logging.getLogger('PIL').setLevel(logging.WARNING)
         
         self.logger = app_logger
+        
+        # Bind the per-level logger methods once instead of resolving them on every log() call
+        self._dispatch = {
+            LogLevel.DEBUG: app_logger.debug,
+            LogLevel.INFO: app_logger.info,
+            LogLevel.WARNING: app_logger.warning,
+            LogLevel.ERROR: app_logger.error,
+            LogLevel.CRITICAL: app_logger.critical
+        }
+    
+    @staticmethod
+    def _release_root_handlers(root_logger: logging.Logger) -> List[logging.Handler]:
+        """Detach all root handlers, draining any background writer, and return the freed handlers"""
+        released = []
+        for handler in root_logger.handlers[:]:
+            root_logger.removeHandler(handler)
+            if isinstance(handler, LogQueueHandler) and handler.listener is not None:
+                handler.listener.stop()
+                released.extend(handler.listener.handlers)
+                handler.close()
+            else:
+                released.append(handler)
+        return released
+    
+    def flush(self):
+        """Block until every queued record has been written, then flush the file"""
+        self._log_queue.join()
+        for handler in self._listener.handlers:
+            handler.flush()
+    
+    def shutdown(self):
+        """Drain and stop the background writer (safe to call more than once).
+        
+        Any later records are written synchronously by the same handlers.
+        """
+        root_logger = logging.getLogger()
+        if self._queue_handler in root_logger.handlers:
+            root_logger.removeHandler(self._queue_handler)
+            self._listener.stop()
+            for handler in self._listener.handlers:
+                root_logger.addHandler(handler)
+        elif self._listener._thread is not None:
+            self._listener.stop()
+        
+        for handler in self._listener.handlers:
+            handler.flush()
+        
+        # Nothing left for the exit hook to do, and it would keep this manager alive until exit
+        atexit.unregister(self.shutdown)
     
     def _add_log_entry(self, entry: LogEntry):
-        """Thread-safe method to add log entry to memory storage"""
+        """Thread-safe method to add log entry to memory storage (level filtering is done by the capture handler)"""
         with self._log_lock:
-            # Check if we should include this log based on our filtering
-            if self.should_log_level(entry.level):
-                self.memory_logs.append(entry)
-                
-                # Trim if too many logs
-                if len(self.memory_logs) > self.max_memory_logs:
-                    self.memory_logs.pop(0)
-                
-                # Notify callbacks in a thread-safe way
-                self._notify_callbacks(entry)
+            if len(self.memory_logs) == self.memory_logs.maxlen:
+                self._unindex_entry(self.memory_logs[0])
+            self.memory_logs.append(entry)
+            self._sequence += 1
+            self._by_level.setdefault(entry.level, deque()).append(entry)
+            self._by_component.setdefault(entry.component, deque()).append(entry)
+            self._pending_batch.append(entry)
+            batch = self._take_pending_batch()
+        
+        # Callbacks run outside _log_lock so readers are never held up by them
+        self._notify_callbacks(entry)
+        if batch:
+            self._notify_batch_callbacks(batch)
+    
+    def _release_pending_batch(self):
+        """Dispatch any held batch once the queue has drained, even if the last record was filtered out"""
+        with self._log_lock:
+            batch = self._take_pending_batch()
+        
+        if batch:
+            self._notify_batch_callbacks(batch)
+    
+    def _take_pending_batch(self) -> Optional[List[LogEntry]]:
+        """Hand over the pending batch unless more records are queued behind it (caller holds _log_lock)"""
+        if not self._pending_batch or (len(self._pending_batch) < CALLBACK_BATCH_SIZE
+                                       and not self._log_queue.empty()):
+            return None
+        batch = self._pending_batch
+        self._pending_batch = []
+        return batch
+    
+    def _unindex_entry(self, entry: LogEntry):
+        """Remove an evicted entry from the level/component indexes (caller holds _log_lock)"""
+        # Entries are evicted in arrival order, so the evicted one is the oldest in its index too
+        for index, key in ((self._by_level, entry.level), (self._by_component, entry.component)):
+            entries = index[key]
+            entries.popleft()
+            if not entries:
+                del index[key]
+    
+    def _smallest_source(self, level_filter: Optional[str], component_filter: Optional[str]):
+        """The shortest of memory_logs and the indexes the filters allow (caller holds _log_lock)"""
+        source = self.memory_logs
+        if level_filter and level_filter != "ALL":
+            source = self._by_level.get(level_filter, ())
+        if component_filter and component_filter != "ALL":
+            by_component = self._by_component.get(component_filter, ())
+            if len(by_component) < len(source):
+                source = by_component
+        return source
     
     def _notify_callbacks(self, entry: LogEntry):
         """Thread-safe callback notification"""
-        with self._callback_lock:
-            callbacks_to_call = self.log_callbacks.copy()
+        if not self.log_callbacks:
+            return
         
         # Call callbacks outside the lock to avoid deadlocks
-        for callback in callbacks_to_call:
+        for callback in self._live_callbacks(self.log_callbacks):
             try:
                 callback(entry)
             except Exception as e:
                 # Use standard logging to avoid recursion
                 self.logger.error(f"Error in log callback: {e}")
     
+    def _notify_batch_callbacks(self, batch: List[LogEntry]):
+        """Hand a batch of new entries to each batch callback"""
+        if not self.batch_callbacks:
+            return
+        
+        for callback in self._live_callbacks(self.batch_callbacks):
+            try:
+                callback(batch)
+            except Exception as e:
+                self.logger.error(f"Error in batch log callback: {e}")
+    
+    def _live_callbacks(self, refs: List[weakref.ref]) -> List[Callable]:
+        """Resolve weak callback references, dropping any whose owner has been collected"""
+        with self._callback_lock:
+            callbacks = [ref() for ref in refs]
+            if None in callbacks:
+                refs[:] = [ref for ref, callback in zip(refs, callbacks) if callback is not None]
+                callbacks = [callback for callback in callbacks if callback is not None]
+        return callbacks
+    
+    def _remove_callback_ref(self, refs: List[weakref.ref], callback: Callable):
+        """Remove the reference to callback, along with any dead references"""
+        with self._callback_lock:
+            refs[:] = [ref for ref in refs if ref() is not None and ref() != callback]
+    
     def should_log_level(self, level: str) -> bool:
         """Check if a log level should be recorded based on current configuration"""
-        level_hierarchy = {
-            'DEBUG': 10,
-            'INFO': 20,
-            'WARNING': 30,
-            'ERROR': 40,
-            'CRITICAL': 50
-        }
-        
-        current_level_value = level_hierarchy.get(self.log_level, 20)
-        message_level_value = level_hierarchy.get(level, 20)
-        
-        return message_level_value >= current_level_value
+        return LEVEL_VALUES.get(level, 20) >= self._level_value
     
     def should_log(self, level: LogLevel) -> bool:
         """Check if a log level should be recorded"""
-        return self.should_log_level(level.value)
+        return level.num >= self._level_value
     
     def add_callback(self, callback: Callable[[LogEntry], None]):
-        """Add callback for real-time log updates"""
+        """Add callback for real-time log updates (held weakly - keep a reference to plain functions)"""
         with self._callback_lock:
-            self.log_callbacks.append(callback)
-        self.log(LogLevel.DEBUG, "LogManager", f"Added log callback (total: {len(self.log_callbacks)})")
+            self.log_callbacks.append(_weak_callback(callback))
+        if self.should_log(LogLevel.DEBUG):
+            self.log(LogLevel.DEBUG, "LogManager", f"Added log callback (total: {len(self.log_callbacks)})")
     
     def remove_callback(self, callback: Callable[[LogEntry], None]):
         """Remove log callback"""
+        self._remove_callback_ref(self.log_callbacks, callback)
+    
+    def add_batch_callback(self, callback: Callable[[List[LogEntry]], None]):
+        """Add callback that receives new log entries in batches (up to CALLBACK_BATCH_SIZE), held weakly"""
         with self._callback_lock:
-            if callback in self.log_callbacks:
-                self.log_callbacks.remove(callback)
+            self.batch_callbacks.append(_weak_callback(callback))
+        if self.should_log(LogLevel.DEBUG):
+            self.log(LogLevel.DEBUG, "LogManager", f"Added batch log callback (total: {len(self.batch_callbacks)})")
+    
+    def remove_batch_callback(self, callback: Callable[[List[LogEntry]], None]):
+        """Remove batch log callback"""
+        self._remove_callback_ref(self.batch_callbacks, callback)
     
     def log(self, level: LogLevel, component: str, message: str, details: Dict = None):
         """Add a log entry through the standard logging system"""
-        # Use the standard logging system which will be captured by our handler
-        log_method = getattr(self.logger, level.value.lower())
+        # Below the configured level - skip all record construction
+        if level.num < self._level_value:
+            return
         
-        # Create a log record with extra details
-        extra = {'details': details} if details else {}
+        # Log through standard logging (will be captured by our handler). The
+        # "[component] message" text is left to logging's deferred %-formatting
+        # and details always ride along on the record, so there is no branching here.
+        self._dispatch[level]("[%s] %s", component, message, extra={'details': details})
+    
+    def _log_function_call(self, component: str, function_name: str, args: tuple = None, kwargs: dict = None):
+        """Log function calls for debugging (bound as log_function_call in debug mode only)"""
+        # Don't stringify arguments for a DEBUG record log() would drop anyway
+        if not self.should_log(LogLevel.DEBUG):
+            return
         
-        # Format the message with component
-        formatted_message = f"[{component}] {message}"
+        details = {}
+        if args:
+            details['args'] = str(args)[:100]  # Limit length
+        if kwargs:
+            details['kwargs'] = {k: str(v)[:50] for k, v in kwargs.items()}  # Limit length
         
-        # Log through standard logging (will be captured by our handler)
-        log_method(formatted_message, extra=extra)
+        self.log(LogLevel.DEBUG, component, f"Function call: {function_name}", details)
+    
+    def performance_logger(self, component: str, operation: str):
+        """Return a PerformanceLogger in debug mode, otherwise a shared no-op context manager"""
+        if self.debug_mode:
+            return PerformanceLogger(self, component, operation)
+        return _NULL_PERFORMANCE_LOGGER
     
     def log_subprocess_output(self, component: str, line: str):
         """Special method for logging subprocess output with proper parsing"""
@@ -239,73 +644,90 @@ class LogManager:
         
         # Try to detect log level from subprocess output
         level = LogLevel.INFO  # Default
-        
-        if any(indicator in line.lower() for indicator in ['error', 'failed', 'exception']):
-            level = LogLevel.ERROR
-        elif any(indicator in line.lower() for indicator in ['warning', 'warn']):
-            level = LogLevel.WARNING
-        elif 'debug' in line.lower():
-            level = LogLevel.DEBUG
-        elif any(indicator in line.lower() for indicator in ['✓', 'success', 'complete']):
-            level = LogLevel.INFO
-        
-        # Clean up the message
-        clean_message = line
+        for pattern, pattern_level in _SUBPROCESS_LEVEL_PATTERNS:
+            if pattern.search(line):
+                level = pattern_level
+                break
         
         # Remove common prefixes that might confuse the display
-        prefixes_to_remove = [
-            'INFO:FileMakerSync:',
-            'DEBUG:FileMakerSync:',
-            'WARNING:FileMakerSync:',
-            'ERROR:FileMakerSync:',
-        ]
-        
-        for prefix in prefixes_to_remove:
-            if clean_message.startswith(prefix):
-                clean_message = clean_message[len(prefix):].strip()
-                break
+        prefix = _SUBPROCESS_PREFIX_RE.match(line)
+        clean_message = line[prefix.end():] if prefix else line
         
         self.log(level, component, clean_message)
     
     def get_recent_logs(self, limit: int = 100, level_filter: str = None, component_filter: str = None) -> List[LogEntry]:
         """Get recent logs with optional filtering (thread-safe)"""
-        with self._log_lock:
-            logs = self.memory_logs.copy()
+        level_wanted = level_filter if level_filter and level_filter != "ALL" else None
+        component_wanted = component_filter if component_filter and component_filter != "ALL" else None
         
-        # Apply filters
-        if level_filter and level_filter != "ALL":
-            logs = [log for log in logs if log.level == level_filter]
-        
-        if component_filter and component_filter != "ALL":
-            logs = [log for log in logs if log.component == component_filter]
+        with self._log_lock:
+            # Walk the smallest index that can hold the matches, newest first
+            recent = reversed(self._smallest_source(level_wanted, component_wanted))
+            if level_wanted:
+                recent = (log for log in recent if log.level == level_wanted)
+            if component_wanted:
+                recent = (log for log in recent if log.component == component_wanted)
+            return list(islice(recent, limit))
+    
+    def filter_recent_logs(self, predicate: Callable[[LogEntry], bool], limit: int,
+                           level_filter: str = None, component_filter: str = None) -> List[LogEntry]:
+        """Newest-first entries matching predicate, up to limit, without copying the whole buffer.
         
-        # Return most recent first, limited
-        return list(reversed(logs[-limit:]))
+        level_filter/component_filter only choose a smaller index to walk; predicate must still check them.
+        """
+        with self._log_lock:
+            source = self._smallest_source(level_filter, component_filter)
+            return list(islice(filter(predicate, reversed(source)), limit))
+    
+    def count_recent_levels(self, levels, limit: int = 100) -> int:
+        """Count how many of the newest `limit` entries have a level in `levels`, without copying entries"""
+        with self._log_lock:
+            return sum(1 for entry in islice(reversed(self.memory_logs), limit) if entry.level in levels)
+    
+    def get_components(self) -> List[str]:
+        """Sorted names of the components that have entries in memory"""
+        with self._log_lock:
+            return sorted(self._by_component)
+    
+    def get_log_sequence(self) -> int:
+        """Running total of entries appended (never decreases, unlike get_log_count)"""
+        return self._sequence
+    
+    def get_logs_since(self, sequence: int) -> Tuple[List[LogEntry], int]:
+        """Entries appended after `sequence` that are still in memory (oldest first), and the current sequence"""
+        with self._log_lock:
+            new_count = max(0, min(self._sequence - sequence, len(self.memory_logs)))
+            entries = list(islice(reversed(self.memory_logs), new_count))
+            current = self._sequence
+        entries.reverse()
+        return entries, current
     
     def get_log_count(self) -> int:
         """Get total log count"""
-        with self._log_lock:
-            return len(self.memory_logs)
+        # A single len() on the deque is atomic on its own; no need to take _log_lock
+        return len(self.memory_logs)
     
     def clear_logs(self):
         """Clear all memory logs"""
         with self._log_lock:
             self.memory_logs.clear()
+            self._by_level.clear()
+            self._by_component.clear()
         self.log(LogLevel.INFO, "LogManager", "Memory logs cleared")
     
     def update_log_level(self, new_level: str):
         """Update the logging level dynamically"""
         old_level = self.log_level
         self.log_level = new_level.upper()
+        self._level_value = LEVEL_VALUES.get(self.log_level, 20)
         
         # Update logger levels
         numeric_level = getattr(logging, self.log_level, logging.INFO)
         self.logger.setLevel(numeric_level)
         
         # Update console handler if it exists
-        for handler in logging.getLogger().handlers:
-            if isinstance(handler, logging.StreamHandler) and handler.stream == sys.stdout:
-                handler.setLevel(numeric_level)
+        if self._console_handler is not None:
+            self._console_handler.setLevel(numeric_level)
         
         self.log(LogLevel.INFO, "LogManager", f"Log level changed from {old_level} to {self.log_level}")
     
@@ -315,31 +737,35 @@ class LogManager:
         
         root_logger = logging.getLogger()
         
-        # Remove existing console handlers
-        for handler in root_logger.handlers[:]:
-            if isinstance(handler, logging.StreamHandler) and handler.stream == sys.stdout:
-                root_logger.removeHandler(handler)
+        # Remove the console handler we added, leaving any other stdout handlers alone
+        if self._console_handler is not None:
+            root_logger.removeHandler(self._console_handler)
+            self._console_handler = None
         
         # Add console handler if enabled
         if enable:
             numeric_level = getattr(logging, self.log_level, logging.INFO)
-            console_handler = logging.StreamHandler(sys.stdout)
-            console_handler.setLevel(numeric_level)
-            formatter = logging.Formatter(
+            self._console_handler = logging.StreamHandler(sys.stdout)
+            self._console_handler.setLevel(numeric_level)
+            formatter = CachedTimeFormatter(
                 '%(asctime)s %(levelname)-8s [%(name)s] %(message)s',
                 '%H:%M:%S'
             )
-            console_handler.setFormatter(formatter)
-            root_logger.addHandler(console_handler)
+            self._console_handler.setFormatter(formatter)
+            root_logger.addHandler(self._console_handler)
         
         self.log(LogLevel.INFO, "LogManager", f"Console logging {'enabled' if enable else 'disabled'}")
     
     def get_log_statistics(self) -> Dict[str, Any]:
         """Get statistics about current logs (thread-safe)"""
         with self._log_lock:
-            logs = self.memory_logs.copy()
+            total_logs = len(self.memory_logs)
+            by_level = {level: len(entries) for level, entries in self._by_level.items()}
+            by_component = {component: len(entries) for component, entries in self._by_component.items()}
+            oldest = self.memory_logs[0] if total_logs else None
+            newest = self.memory_logs[-1] if total_logs else None
         
-        if not logs:
+        if not total_logs:
             return {
                 'total_logs': 0,
                 'by_level': {},
@@ -351,20 +777,12 @@ class LogManager:
                 'debug_mode': self.debug_mode
             }
         
-        # Count by level and component
-        by_level = {}
-        by_component = {}
-        
-        for log in logs:
-            by_level[log.level] = by_level.get(log.level, 0) + 1
-            by_component[log.component] = by_component.get(log.component, 0) + 1
-        
         return {
-            'total_logs': len(logs),
+            'total_logs': total_logs,
             'by_level': by_level,
             'by_component': by_component,
-            'oldest_entry': logs[0].timestamp if logs else None,
-            'newest_entry': logs[-1].timestamp if logs else None,
+            'oldest_entry': oldest.timestamp,
+            'newest_entry': newest.timestamp,
             'current_level': self.log_level,
             'console_enabled': self.console_logging,
             'debug_mode': self.debug_mode,
@@ -379,25 +797,37 @@ class LogManager:
         
         if filepath.suffix.lower() == '.json':
             # Export as JSON
-            with open(filepath, 'w', encoding='utf-8') as f:
-                json.dump([asdict(log) for log in logs], f, indent=2)
+            if orjson is not None:
+                with open(filepath, 'wb') as f:
+                    f.write(orjson.dumps([log.to_dict() for log in logs],
+                                         option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+            else:
+                with open(filepath, 'w', encoding='utf-8') as f:
+                    json.dump([log.to_dict() for log in logs], f, indent=2)
         else:
-            # Export as text
-            with open(filepath, 'w', encoding='utf-8') as f:
-                f.write("FileMaker Sync Log Export\n")
-                f.write("=" * 50 + "\n")
-                f.write(f"Export Date: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-                f.write(f"Session ID: {self.session_id}\n")
-                f.write(f"Log Level: {self.log_level}\n")
-                f.write(f"Debug Mode: {self.debug_mode}\n")
-                f.write(f"Total Entries: {len(logs)}\n\n")
-                
+            # Export as text - records are formatted as they are written, through a large buffer,
+            # so the export never holds the whole text in memory
+            header = (
+                "FileMaker Sync Log Export\n"
+                + "=" * 50 + "\n"
+                + f"Export Date: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n"
+                f"Session ID: {self.session_id}\n"
+                f"Log Level: {self.log_level}\n"
+                f"Debug Mode: {self.debug_mode}\n"
+                f"Total Entries: {len(logs)}\n\n"
+            )
+            
+            def records():
                 for log in logs:
-                    f.write(f"[{log.timestamp}] {log.level} - {log.component}\n")
-                    f.write(f"  {log.message}\n")
                     if log.details and self.debug_mode:
-                        f.write(f"  Details: {json.dumps(log.details)}\n")
-                    f.write("\n")
+                        yield (f"[{log.timestamp}] {log.level} - {log.component}\n  {log.message}\n"
+                               f"  Details: {_format_details(log.details, max_length=None)}\n\n")
+                    else:
+                        yield f"[{log.timestamp}] {log.level} - {log.component}\n  {log.message}\n\n"
+            
+            with open(filepath, 'w', encoding='utf-8', buffering=EXPORT_BUFFER_SIZE) as f:
+                f.write(header)
+                f.writelines(records())
     
     def test_logging(self):
         """Generate test log entries for debugging the logging system"""
@@ -420,49 +850,58 @@ class LogManager:
 class ErrorTracker:
     """Track and analyze error patterns with configurable sensitivity"""
     
+    # Error buckets in priority order with the keywords that select them
+    ERROR_PATTERNS = (
+        ('Connection Issues', ('connect',)),  # also covers 'connection'
+        ('Permission Issues', ('permission', 'access', 'denied')),
+        ('Timeout Issues', ('timeout',)),
+        ('Resource Not Found', ('not found', 'missing')),
+        ('Database Issues', ('sql', 'database')),
+        ('File System Issues', ('file', 'directory')),
+    )
+    
+    _KEYWORD_RANKS = {keyword: rank
+                      for rank, (_, keywords) in enumerate(ERROR_PATTERNS)
+                      for keyword in keywords}
+    
+    # Zero-width lookahead so one scan reports every (possibly overlapping) keyword occurrence
+    _KEYWORD_RE = re.compile(
+        '(?=(' + '|'.join(re.escape(keyword) for keyword in _KEYWORD_RANKS) + '))',
+        # ASCII-only case folding, as message.lower() matching did: Unicode folding would also match
+        # spellings like 'ſql' whose lower() is not a _KEYWORD_RANKS key
+        re.IGNORECASE | re.ASCII
+    )
+    
     def __init__(self, log_manager: LogManager):
         self.log_manager = log_manager
     
+    @classmethod
+    def classify_error(cls, message: str) -> str:
+        """Return the highest-priority error bucket whose keywords appear in the message"""
+        best_rank = None
+        for match in cls._KEYWORD_RE.finditer(message):
+            rank = cls._KEYWORD_RANKS[match.group(1).lower()]
+            if best_rank is None or rank < best_rank:
+                best_rank = rank
+                if rank == 0:
+                    break
+        return cls.ERROR_PATTERNS[best_rank][0] if best_rank is not None else 'Other Errors'
+    
     def get_error_summary(self, hours_back: int = 24) -> Dict[str, Any]:
         """Get summary of recent errors with enhanced analysis"""
         recent_logs = self.log_manager.get_recent_logs(limit=1000)
-        error_logs = [log for log in recent_logs if log.level in ['ERROR', 'CRITICAL']]
+        error_logs = [log for log in recent_logs if log.level in ERROR_LEVELS]
         warning_logs = [log for log in recent_logs if log.level == 'WARNING']
         
-        # Group by component
-        by_component = {}
-        for log in error_logs:
-            component = log.component
-            if component not in by_component:
-                by_component[component] = []
-            by_component[component].append(log)
-        
-        # Analyze error patterns
-        error_patterns = {}
-        for log in error_logs:
-            message_lower = log.message.lower()
-            if 'connection' in message_lower or 'connect' in message_lower:
-                pattern = 'Connection Issues'
-            elif 'permission' in message_lower or 'access' in message_lower or 'denied' in message_lower:
-                pattern = 'Permission Issues'
-            elif 'timeout' in message_lower:
-                pattern = 'Timeout Issues'
-            elif 'not found' in message_lower or 'missing' in message_lower:
-                pattern = 'Resource Not Found'
-            elif 'sql' in message_lower or 'database' in message_lower:
-                pattern = 'Database Issues'
-            elif 'file' in message_lower or 'directory' in message_lower:
-                pattern = 'File System Issues'
-            else:
-                pattern = 'Other Errors'
-            
-            error_patterns[pattern] = error_patterns.get(pattern, 0) + 1
+        # Group by component and by error pattern
+        by_component = Counter(log.component for log in error_logs)
+        error_patterns = Counter(self.classify_error(log.message) for log in error_logs)
         
         return {
             'total_errors': len(error_logs),
             'total_warnings': len(warning_logs),
-            'by_component': {k: len(v) for k, v in by_component.items()},
-            'error_patterns': error_patterns,
+            'by_component': dict(by_component),
+            'error_patterns': dict(error_patterns),
             'recent_errors': error_logs[:10],  # Last 10 errors
             'severity_assessment': self._assess_severity(error_logs, warning_logs),
             'session_id': self.log_manager.session_id
@@ -497,14 +936,12 @@ class PerformanceLogger:
     
     def __enter__(self):
         if self.logger.debug_mode:
-            import time
             self.start_time = time.time()
             self.logger.log(LogLevel.DEBUG, self.component, f"Starting: {self.operation}")
         return self
     
     def __exit__(self, exc_type, exc_val, exc_tb):
         if self.logger.debug_mode and self.start_time:
-            import time
             duration = time.time() - self.start_time
             
             if exc_type:
@@ -532,11 +969,4 @@ def create_debug_logger(component_name: str, config: Dict = None) -> LogManager:
 
 def log_function_call(logger: LogManager, component: str, function_name: str, args: tuple = None, kwargs: dict = None):
     """Log function calls for debugging (only in debug mode)"""
-    if logger.debug_mode:
-        details = {}
-        if args:
-            details['args'] = str(args)[:100]  # Limit length
-        if kwargs:
-            details['kwargs'] = {k: str(v)[:50] for k, v in kwargs.items()}  # Limit length
-        
-        logger.log(LogLevel.DEBUG, component, f"Function call: {function_name}", details)
\ No newline at end of file
+    logger.log_function_call(component, function_name, args, kwargs)
@@ -8,48 +8,77 @@ Ensures the newest log entry is always visible and selected when logs are update
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
 from pathlib import Path
-from datetime import datetime
+from datetime import datetime, timedelta
 from typing import List, Optional, Callable
 from dataclasses import asdict
+from collections import deque
+from operator import attrgetter
+import heapq
 import re
 import threading
-import queue
 import time
 
-from gui_logging import LogManager, LogEntry, LogLevel
+from gui_logging import LogManager, LogEntry, LogLevel, ERROR_LEVELS
 
 class SortableTreeview(ttk.Treeview):
-    """Enhanced Treeview with sortable columns and latest entry focus"""
+    """Sortable Treeview that only renders the rows currently in view (virtual scrolling).
+    
+    The full list of rows lives in self.rows as (values, tags, entry) tuples; the tree itself
+    holds just enough placeholder items to fill the viewport and they are rewritten on scroll.
+    """
+    
+    LEVEL_PRIORITY = {'DEBUG': 1, 'INFO': 2, 'WARNING': 3, 'ERROR': 4, 'CRITICAL': 5}
     
     def __init__(self, parent, **kwargs):
+        kwargs.setdefault('selectmode', 'browse')
         super().__init__(parent, **kwargs)
         self.sort_column = None
         self.sort_reverse = False
-        self.original_data = []
+        self.rows = []
         self.latest_entry_focus = True  # Flag to control latest entry focus
         
-        # Bind header clicks for sorting
-        self.bind('<Button-1>', self.on_header_click)
-    
-    def on_header_click(self, event):
-        """Handle header clicks for sorting"""
-        region = self.identify_region(event.x, event.y)
-        if region == 'heading':
-            column = self.identify_column(event.x)
-            if column:
-                # Convert column index to column name
-                if column == '#1':
-                    col_name = self['columns'][0]
-                elif column == '#2':
-                    col_name = self['columns'][1]
-                elif column == '#3':
-                    col_name = self['columns'][2]
-                elif column == '#4':
-                    col_name = self['columns'][3]
-                else:
-                    return
-                
-                self.sort_by_column(col_name)
+        # Viewport state: index of the first visible row and the placeholder items showing it
+        self._top = 0
+        self._selected_index = None
+        self._slots = [self.insert('', 'end') for _ in range(int(self.cget('height')))]
+        self._detached = set()
+        self._yscroll_set = None
+        
+        # Heading text without sort indicators, and what each heading currently shows
+        self._base_headings = {}
+        self._heading_texts = {}
+        
+        self.bind('<Configure>', self._on_configure)
+        self.bind('<<TreeviewSelect>>', self._on_select, add='+')
+        self.bind('<MouseWheel>', self._on_mousewheel)
+        self.bind('<Button-4>', lambda event: self._scroll_by(-3))
+        self.bind('<Button-5>', lambda event: self._scroll_by(3))
+        for key, step in (('<Up>', -1), ('<Down>', 1), ('<Prior>', 'page-up'), ('<Next>', 'page-down'),
+                          ('<Home>', 'first'), ('<End>', 'last')):
+            self.bind(key, lambda event, step=step: self._on_key(step))
+    
+    def set_yscroll(self, callback: Callable):
+        """Set the callback (normally Scrollbar.set) that receives the virtual scroll position"""
+        self._yscroll_set = callback
+    
+    def yview(self, *args):
+        """Scroll through self.rows rather than the placeholder items"""
+        if not args:
+            return self._view_fractions()
+        
+        if args[0] == 'moveto':
+            self._top = int(float(args[1]) * len(self.rows))
+        elif args[0] == 'scroll':
+            amount = int(args[1])
+            self._top += amount * len(self._slots) if args[2] == 'pages' else amount
+        self._render()
+    
+    def set_rows(self, rows: List[tuple]):
+        """Replace the displayed rows, keeping the current sort order"""
+        self.rows = list(rows)
+        self._selected_index = None
+        self._apply_sort()
+        self._render()
     
     def sort_by_column(self, column: str):
         """Sort the treeview by the specified column"""
@@ -61,28 +90,7 @@ class SortableTreeview(ttk.Treeview):
                 self.sort_column = column
                 self.sort_reverse = False
             
-            # Get all data
-            data = []
-            for item in self.get_children():
-                values = self.item(item)['values']
-                data.append((item, values))
-            
-            # Sort data based on column
-            if column == 'Time':
-                # Sort by timestamp
-                data.sort(key=lambda x: self._parse_time_for_sort(x[1][0]), reverse=self.sort_reverse)
-            elif column == 'Level':
-                # Sort by log level priority
-                level_priority = {'DEBUG': 1, 'INFO': 2, 'WARNING': 3, 'ERROR': 4, 'CRITICAL': 5}
-                data.sort(key=lambda x: level_priority.get(x[1][1], 0), reverse=self.sort_reverse)
-            else:
-                # Sort alphabetically
-                col_index = {'Time': 0, 'Level': 1, 'Component': 2, 'Message': 3}[column]
-                data.sort(key=lambda x: str(x[1][col_index]).lower(), reverse=self.sort_reverse)
-            
-            # Update treeview
-            for index, (item, values) in enumerate(data):
-                self.move(item, '', index)
+            self._apply_sort()
             
             # Update header to show sort direction
             self._update_column_headers()
@@ -90,107 +98,239 @@ class SortableTreeview(ttk.Treeview):
             # Focus on latest entry if sorting by time
             if column == 'Time' and self.latest_entry_focus:
                 self.focus_latest_entry()
+            else:
+                self._render()
             
         except Exception as e:
             print(f"Error sorting by column {column}: {e}")
     
+    def _apply_sort(self):
+        """Order self.rows by the current sort column"""
+        column = self.sort_column
+        if not column:
+            return
+        
+        if column == 'Time':
+            # Sort by the entry's own timestamp
+            self.rows.sort(key=lambda row: row[2].created, reverse=self.sort_reverse)
+        elif column == 'Level':
+            # Sort by log level priority
+            self.rows.sort(key=lambda row: self.LEVEL_PRIORITY.get(row[0][1], 0), reverse=self.sort_reverse)
+        else:
+            # Sort alphabetically
+            col_index = {'Time': 0, 'Level': 1, 'Component': 2, 'Message': 3}[column]
+            self.rows.sort(key=lambda row: str(row[0][col_index]).lower(), reverse=self.sort_reverse)
+    
     def focus_latest_entry(self):
         """Focus on the latest entry based on current sort"""
         try:
-            children = self.get_children()
-            if not children:
+            if not self.rows:
                 return
             
-            # Determine which is the "latest" based on current sort
-            if self.sort_column == 'Time':
-                # If sorting by time descending (newest first), focus on first item
-                # If sorting by time ascending (oldest first), focus on last item
-                latest_item = children[0] if self.sort_reverse else children[-1]
+            # Newest first when sorting by time descending, otherwise the last row added
+            if self.sort_column == 'Time' and self.sort_reverse:
+                self.select_index(0)
             else:
-                # For other sorts, focus on the last item added
-                latest_item = children[-1]
-            
-            # Clear current selection and focus on latest
-            self.selection_remove(self.selection())
-            self.selection_set(latest_item)
-            self.focus(latest_item)
-            self.see(latest_item)
+                self.select_index(len(self.rows) - 1)
             
         except Exception as e:
             print(f"Error focusing latest entry: {e}")
     
-    def add_entry_and_focus(self, values, tags=None):
-        """Add entry and immediately focus on it if it's the latest"""
+    def add_rows(self, rows: List[tuple], focus_latest: bool = False, max_rows: int = None):
+        """Add new rows in arrival order, optionally focusing on the last one and dropping the oldest beyond max_rows"""
         try:
-            # Insert the new entry
-            item = self.insert('', 'end', values=values, tags=tags or ())
-            
-            # If auto-focus is enabled and we're not sorting or sorting by time descending
-            if self.latest_entry_focus:
-                if not self.sort_column or (self.sort_column == 'Time' and self.sort_reverse):
-                    # Re-sort to get correct position
-                    if self.sort_column:
-                        self.sort_by_column(self.sort_column)
-                    else:
-                        # Default behavior - focus on the newly added item
-                        self.selection_remove(self.selection())
-                        self.selection_set(item)
-                        self.focus(item)
-                        self.see(item)
-            
-            return item
+            newest_first = self.sort_column == 'Time' and self.sort_reverse
+            if newest_first:
+                self.rows[:0] = reversed(rows)
+                # Keep the rows the user is looking at in place
+                if self._top > 0:
+                    self._top += len(rows)
+                if self._selected_index is not None:
+                    self._selected_index += len(rows)
+                if max_rows is not None:
+                    del self.rows[max_rows:]
+            elif self.sort_column and self.sort_column != 'Time':
+                self._merge_sorted_rows(rows, max_rows)
+            else:
+                self.rows.extend(rows)
+                excess = len(self.rows) - max_rows if max_rows is not None else 0
+                if excess > 0:
+                    del self.rows[:excess]
+                    self._top = max(0, self._top - excess)
+                    if self._selected_index is not None:
+                        self._selected_index = self._selected_index - excess if self._selected_index >= excess else None
+            
+            if self._selected_index is not None and self._selected_index >= len(self.rows):
+                self._selected_index = None
+            
+            # Focus only when new rows land where the latest entry is expected
+            if focus_latest and self.latest_entry_focus and (not self.sort_column or newest_first):
+                self.select_index(0 if newest_first else len(self.rows) - 1)
+            else:
+                self._render()
             
         except Exception as e:
-            print(f"Error adding entry and focusing: {e}")
-            return None
+            print(f"Error adding entries: {e}")
     
-    def _parse_time_for_sort(self, time_str: str) -> datetime:
-        """Parse time string for sorting"""
-        try:
-            # Try to parse as HH:MM:SS format first
-            if ':' in time_str and len(time_str) <= 12:
-                # Convert HH:MM:SS.mmm to full datetime for sorting
-                today = datetime.now().date()
-                time_parts = time_str.split(':')
-                hour = int(time_parts[0])
-                minute = int(time_parts[1])
-                
-                # Handle seconds with milliseconds
-                second_part = time_parts[2] if len(time_parts) > 2 else "0"
-                if '.' in second_part:
-                    second = int(float(second_part))
-                    microsecond = int((float(second_part) % 1) * 1000000)
-                else:
-                    second = int(second_part)
-                    microsecond = 0
-                
-                return datetime.combine(today, datetime.min.time().replace(
-                    hour=hour, minute=minute, second=second, microsecond=microsecond
-                ))
-            else:
-                # Try to parse as ISO format
-                return datetime.fromisoformat(time_str.replace('Z', '+00:00'))
-        except:
-            # Fallback to current time if parsing fails
-            return datetime.now()
+    def _merge_sorted_rows(self, rows: List[tuple], max_rows: int = None):
+        """Place new rows by the active (non-Time) sort and drop the oldest entries beyond max_rows"""
+        selected = self.rows[self._selected_index] if self._selected_index is not None else None
+        
+        # Rows are already in order, so the stable re-sort is close to a linear merge
+        self.rows.extend(rows)
+        self._apply_sort()
+        
+        excess = len(self.rows) - max_rows if max_rows is not None else 0
+        if excess > 0:
+            # Position says nothing about age under this sort - drop by creation time
+            oldest = {id(entry) for entry in heapq.nsmallest(excess, (row[2] for row in self.rows),
+                                                              key=attrgetter('created'))}
+            self.rows = [row for row in self.rows if id(row[2]) not in oldest]
+        
+        self._selected_index = next((i for i, row in enumerate(self.rows) if row is selected), None)
+        self._top = min(self._top, max(0, len(self.rows) - 1))
+    
+    def select_index(self, index: int):
+        """Select, focus and scroll to the row at index"""
+        self._selected_index = index
+        visible = len(self._slots)
+        if index < self._top:
+            self._top = index
+        elif index >= self._top + visible:
+            self._top = index - visible + 1
+        self._render()
+    
+    def selected_row(self) -> Optional[tuple]:
+        """Row tuple of the current selection, if any"""
+        index = self._selected_index
+        if index is not None and index < len(self.rows):
+            return self.rows[index]
+        return None
+    
+    def _view_fractions(self):
+        total = len(self.rows)
+        if not total:
+            return 0.0, 1.0
+        return self._top / total, min(1.0, (self._top + len(self._slots)) / total)
+    
+    def _render(self):
+        """Write the visible slice of self.rows into the placeholder items"""
+        rows = self.rows
+        visible = len(self._slots)
+        self._top = max(0, min(self._top, len(rows) - visible))
+        top = self._top
+        
+        for position, iid in enumerate(self._slots):
+            index = top + position
+            if index < len(rows):
+                values, tags, _ = rows[index]
+                self.item(iid, values=values, tags=tags)
+                if iid in self._detached:
+                    self.move(iid, '', position)
+                    self._detached.discard(iid)
+            elif iid not in self._detached:
+                self.detach(iid)
+                self._detached.add(iid)
+        
+        # Reflect the selected row if it is on screen
+        selected = self._selected_index
+        if selected is not None and top <= selected < min(top + visible, len(rows)):
+            iid = self._slots[selected - top]
+            if self.selection() != (iid,):
+                self.selection_set(iid)
+            self.focus(iid)
+        elif self.selection():
+            self.selection_remove(self.selection())
+        
+        if self._yscroll_set:
+            self._yscroll_set(*self._view_fractions())
+    
+    def _on_configure(self, event):
+        """Match the number of placeholder items to the rows that fit in the widget"""
+        bbox = self.bbox(self._slots[0]) if self._slots and self._slots[0] not in self._detached else None
+        if bbox:
+            header_height, row_height = bbox[1], bbox[3]
+        else:
+            row_height = int(ttk.Style().lookup('Treeview', 'rowheight') or 20)
+            header_height = row_height
+        
+        count = max(1, (event.height - header_height - 2) // max(1, row_height))
+        if count == len(self._slots):
+            return
+        
+        while len(self._slots) < count:
+            iid = self.insert('', 'end')
+            self._slots.append(iid)
+        while len(self._slots) > count:
+            iid = self._slots.pop()
+            self._detached.discard(iid)
+            self.delete(iid)
+        self._render()
+    
+    def _on_select(self, event):
+        selection = self.selection()
+        if selection and selection[0] in self._slots:
+            self._selected_index = self._top + self._slots.index(selection[0])
+    
+    def _on_mousewheel(self, event):
+        delta = event.delta if abs(event.delta) < 120 else event.delta // 120
+        self._scroll_by(-3 * delta)
+        return 'break'
+    
+    def _scroll_by(self, amount: int):
+        self._top += amount
+        self._render()
+        return 'break'
+    
+    def _on_key(self, step):
+        """Move the selection through self.rows with the keyboard"""
+        if not self.rows:
+            return 'break'
+        
+        current = self._selected_index if self._selected_index is not None else self._top
+        if step == 'first':
+            index = 0
+        elif step == 'last':
+            index = len(self.rows) - 1
+        elif step == 'page-up':
+            index = current - len(self._slots)
+        elif step == 'page-down':
+            index = current + len(self._slots)
+        else:
+            index = current + step
+        self.select_index(max(0, min(index, len(self.rows) - 1)))
+        return 'break'
     
     def _update_column_headers(self):
         """Update column headers to show sort indicators"""
         for col in self['columns']:
-            current_heading = self.heading(col)['text']
-            # Remove existing sort indicators
-            clean_heading = current_heading.replace(' ↑', '').replace(' ↓', '')
+            base = self._base_headings.get(col)
+            if base is None:
+                # Read each heading once, without whatever indicator it was created with
+                base = self._base_headings[col] = self.heading(col)['text'].rstrip(' ↑↓')
             
+            text = base
             if col == self.sort_column:
                 # Add sort indicator
-                indicator = ' ↓' if self.sort_reverse else ' ↑'
-                self.heading(col, text=clean_heading + indicator)
-            else:
-                self.heading(col, text=clean_heading)
+                text += ' ↓' if self.sort_reverse else ' ↑'
+            
+            # Only the headings whose indicator changed need a Tk call
+            if self._heading_texts.get(col) != text:
+                self.heading(col, text=text)
+                self._heading_texts[col] = text
 
 class LogViewerWindow:
     """Enhanced thread-safe log viewer with latest entry always in focus"""
     
+    # Detail popup: characters of details JSON shown up front, and per idle tick when showing the rest
+    DETAIL_DISPLAY_LIMIT = 64 * 1024
+    DETAIL_CHUNK_SIZE = 100 * 1024
+    # Auto-refresh poll interval while the window is minimized (ms)
+    HIDDEN_REFRESH_INTERVAL = 15000
+    # GUI update queue poll interval (ms): while updates are flowing, and the most it backs off to when idle
+    GUI_POLL_BUSY_MS = 50
+    GUI_POLL_IDLE_MS = 500
+    
     def __init__(self, parent, log_manager: LogManager):
         self.parent = parent
         self.log_manager = log_manager
@@ -199,17 +339,23 @@ class LogViewerWindow:
         # Thread safety infrastructure
         self._destroyed = False
         self._update_lock = threading.RLock()
-        self._gui_update_queue = queue.Queue(maxsize=50)
+        # Plain deque: append/popleft are atomic, and only the Tk thread pops
+        self._gui_update_queue = deque(maxlen=50)
         
         # Timers and refresh control
         self._refresh_timer = None
-        self._search_timer = None
+        self._pending_refresh_timer = None  # debounced full refresh (filters/search)
         self._gui_processor_timer = None
+        self._gui_processor_delay = self.GUI_POLL_BUSY_MS
         
         # Auto-scroll and refresh settings with working variables
         self.auto_scroll_var = tk.BooleanVar(value=True)
         self.auto_refresh_var = tk.BooleanVar(value=True)
         self.auto_focus_latest_var = tk.BooleanVar(value=True)  # NEW: Control latest entry focus
+        # Plain mirrors of the checkboxes for hot paths and worker threads, set by their toggle handlers
+        self._auto_scroll = True
+        self._auto_refresh = True
+        self._auto_focus_latest = True
         self.refresh_interval = 2000  # 2 seconds for responsive updates
         
         # Current log count to detect new logs
@@ -217,6 +363,19 @@ class LogViewerWindow:
         self.last_refresh_time = 0
         self.last_displayed_log_id = None  # Track last displayed log for focus
         
+        # Most rows kept in the viewer, and what has been loaded so far for incremental updates
+        self.max_display_logs = 2000
+        self._last_sequence = 0
+        self._last_filter_sig = None
+        self._refresh_overlap = set()
+        self._search_text_cache = {}
+        self._row_cache = {}
+        self._component_values = ()
+        self._last_status = None  # Last text pushed to status_var
+        self._last_stats_text = None  # Last text shown in the header stats label
+        self._idle_updates = set()  # Updates already waiting for the next idle point
+        self._entries_update_pending = False  # A process_new_entries call is already queued
+        
         # Sort settings - default to newest first (Time descending)
         self.default_sort_column = 'Time'
         self.default_sort_reverse = True  # Newest first
@@ -225,8 +384,8 @@ class LogViewerWindow:
         self.create_window()
         self.create_widgets()
         
-        # Register callback for new log entries (thread-safe)
-        self.log_manager.add_callback(self.on_new_log_entry)
+        # Register callback for batches of new log entries (thread-safe)
+        self.log_manager.add_batch_callback(self.on_new_log_entries)
         
         # Start thread-safe GUI update processor
         self.start_gui_update_processor()
@@ -251,6 +410,9 @@ class LogViewerWindow:
         # Set proper window management
         self.window.protocol("WM_DELETE_WINDOW", self.close_window_safe)
         
+        # Catch up straight away when shown again, rather than on the next (slower) hidden-window poll
+        self.window.bind('<Map>', self.on_window_mapped)
+        
         # Center window on parent
         self.center_on_parent()
         
@@ -296,9 +458,7 @@ class LogViewerWindow:
             # Stop all timers
             self.stop_auto_refresh()
             
-            if self._search_timer:
-                self.window.after_cancel(self._search_timer)
-                self._search_timer = None
+            self._cancel_pending_refresh()
             
             if self._gui_processor_timer:
                 self.window.after_cancel(self._gui_processor_timer)
@@ -306,7 +466,7 @@ class LogViewerWindow:
             
             # Remove callback from log manager
             try:
-                self.log_manager.remove_callback(self.on_new_log_entry)
+                self.log_manager.remove_batch_callback(self.on_new_log_entries)
             except:
                 pass
             
@@ -328,16 +488,16 @@ class LogViewerWindow:
             if self._destroyed:
                 return
             
+            updates_processed = 0
             try:
                 # Process up to 10 updates per cycle to prevent blocking
-                updates_processed = 0
-                while not self._gui_update_queue.empty() and updates_processed < 10:
+                while self._gui_update_queue and updates_processed < 10:
                     try:
-                        update_func = self._gui_update_queue.get_nowait()
+                        update_func = self._gui_update_queue.popleft()
                         if callable(update_func):
                             update_func()
                         updates_processed += 1
-                    except queue.Empty:
+                    except IndexError:
                         break
                     except Exception as e:
                         print(f"Error processing GUI update: {e}")
@@ -346,24 +506,32 @@ class LogViewerWindow:
                 print(f"Error in GUI update processor: {e}")
             
             finally:
+                # Poll quickly while there is work, backing off towards the idle interval otherwise
+                if updates_processed:
+                    self._gui_processor_delay = self.GUI_POLL_BUSY_MS
+                else:
+                    self._gui_processor_delay = min(self._gui_processor_delay * 2, self.GUI_POLL_IDLE_MS)
+                
                 # Schedule next processing
                 if not self._destroyed and self.window and self.window.winfo_exists():
-                    self._gui_processor_timer = self.window.after(100, process_gui_updates)
+                    self._gui_processor_timer = self.window.after(self._gui_processor_delay, process_gui_updates)
         
         # Start the processor
         if not self._destroyed:
             self._gui_processor_timer = self.window.after(100, process_gui_updates)
     
-    def schedule_gui_update(self, update_func):
-        """Thread-safely schedule a GUI update"""
+    def schedule_gui_update(self, update_func) -> bool:
+        """Thread-safely schedule a GUI update; False if it was not queued"""
         if self._destroyed:
-            return
+            return False
         
-        try:
-            self._gui_update_queue.put_nowait(update_func)
-        except queue.Full:
+        if len(self._gui_update_queue) >= self._gui_update_queue.maxlen:
             # Queue is full, skip this update
             print("GUI update queue full, skipping update")
+            return False
+        
+        self._gui_update_queue.append(update_func)
+        return True
     
     def create_widgets(self):
         """Create the log viewer interface"""
@@ -509,7 +677,8 @@ class LogViewerWindow:
         v_scrollbar = ttk.Scrollbar(log_frame, orient='vertical', command=self.log_tree.yview)
         h_scrollbar = ttk.Scrollbar(log_frame, orient='horizontal', command=self.log_tree.xview)
         
-        self.log_tree.configure(yscrollcommand=v_scrollbar.set, xscrollcommand=h_scrollbar.set)
+        self.log_tree.set_yscroll(v_scrollbar.set)
+        self.log_tree.configure(xscrollcommand=h_scrollbar.set)
         
         # Pack everything
         self.log_tree.grid(row=0, column=0, sticky='nsew')
@@ -559,8 +728,9 @@ class LogViewerWindow:
     # NEW: Auto-focus toggle handler
     def on_auto_focus_toggle(self):
         """Handle auto-focus latest toggle"""
-        self.log_tree.latest_entry_focus = self.auto_focus_latest_var.get()
-        if self.auto_focus_latest_var.get():
+        self._auto_focus_latest = self.auto_focus_latest_var.get()
+        self.log_tree.latest_entry_focus = self._auto_focus_latest
+        if self._auto_focus_latest:
             # Immediately focus on latest when enabled
             self.schedule_gui_update(self.log_tree.focus_latest_entry)
     
@@ -573,68 +743,63 @@ class LogViewerWindow:
         self.schedule_gui_update(focus_latest)
     
     # Thread-safe event handlers
-    def on_new_log_entry(self, log_entry: LogEntry):
-        """Thread-safe handler for new log entries - ENHANCED WITH FOCUS"""
+    def on_new_log_entries(self, log_entries: List[LogEntry]):
+        """Thread-safe handler for a batch of new log entries - one GUI update per batch"""
         if self._destroyed:
             return
         
-        def process_new_entry():
+        # Bursts of batches collapse into one pending update: it reads everything logged since the last one
+        if self._entries_update_pending:
+            return
+        self._entries_update_pending = True
+        
+        def process_new_entries():
+            # Cleared before reading, so entries logged from here on schedule a fresh update
+            self._entries_update_pending = False
             try:
+                if not self.window.winfo_viewable():
+                    # Hidden or minimized - nothing to draw; on_window_mapped catches up when it is shown again
+                    return
+                
                 # Always update the statistics
                 self.update_statistics_display()
                 
                 # Update live indicator
                 self.live_indicator.configure(foreground='green')
                 
-                # If auto-refresh is enabled, add the new entry
-                if self.auto_refresh_var.get() and self.entry_matches_filters(log_entry):
-                    self.add_single_log_entry(log_entry, focus_if_latest=True)
-                    
-                    # Update status display
-                    self.update_status_display()
+                # If auto-refresh is enabled, add whatever has arrived since the last update
+                if self._auto_refresh:
+                    self.append_new_logs()
                     
             except Exception as e:
-                print(f"Error processing new log entry: {e}")
+                print(f"Error processing new log entries: {e}")
         
-        self.schedule_gui_update(process_new_entry)
+        if not self.schedule_gui_update(process_new_entries):
+            # Refused - let the next batch try again rather than waiting on an update that never runs
+            self._entries_update_pending = False
     
-    def add_single_log_entry(self, entry: LogEntry, focus_if_latest: bool = False):
-        """Add a single log entry with optional focus on latest"""
-        try:
-            time_str = self.format_time(entry.timestamp)
-            message = self.truncate_message(entry.message, 100)
-            
-            # Determine row tag for coloring
-            tag = entry.level if entry.level in ['ERROR', 'CRITICAL', 'WARNING', 'DEBUG', 'INFO'] else ''
-            
-            # Use the enhanced add method that handles focus
-            if focus_if_latest and self.auto_focus_latest_var.get():
-                self.log_tree.add_entry_and_focus(
-                    values=(time_str, entry.level, entry.component, message),
-                    tags=(tag,)
-                )
-            else:
-                self.log_tree.insert('', 'end', 
-                                    values=(time_str, entry.level, entry.component, message),
-                                    tags=(tag,))
-            
-            # Track this as the last displayed log
-            self.last_displayed_log_id = entry.timestamp
-            
-        except Exception as e:
-            print(f"Error adding single log entry: {e}")
+    def on_window_mapped(self, event):
+        """Pick up entries logged while the window was hidden or minimized"""
+        # <Map> is also delivered here for every child widget - only the window itself matters
+        if event.widget is not self.window or self._destroyed:
+            return
+        
+        # Both the poll and the new-entry callback skip their work while hidden, so bring both up to date
+        self.update_when_idle(self.update_statistics_display)
+        if self._auto_refresh and self.log_manager.get_log_sequence() != self._last_sequence:
+            self.update_when_idle(self.append_new_logs)
     
     def on_auto_scroll_toggle(self):
         """Handle auto-scroll toggle"""
-        if self.auto_scroll_var.get():
+        self._auto_scroll = self.auto_scroll_var.get()
+        if self._auto_scroll:
             # Immediately scroll to latest when enabled
             self.schedule_gui_update(self.auto_scroll_to_latest)
     
     def auto_scroll_to_latest(self):
         """Scroll to the latest entry based on current sort"""
         try:
-            children = self.log_tree.get_children()
-            if not children:
+            if not self.log_tree.rows:
                 return
             
             # Use the enhanced focus method
@@ -645,25 +810,29 @@ class LogViewerWindow:
     
     def on_filter_change_safe(self, event=None):
         """Thread-safe filter change handler"""
-        def refresh_with_delay():
-            self.schedule_gui_update(self.refresh_logs)
-        
         # Small delay to prevent rapid refreshes
-        if not self._destroyed:
-            self.window.after(200, refresh_with_delay)
+        self._schedule_refresh(200)
     
     def on_search_change_safe(self, event=None):
         """Thread-safe search change handler with debounce"""
+        self._schedule_refresh(500)
+    
+    def _schedule_refresh(self, delay_ms: int):
+        """Debounce full refreshes: each trigger restarts the one pending timer"""
         if self._destroyed:
             return
         
-        if self._search_timer:
-            self.window.after_cancel(self._search_timer)
-        
-        def delayed_refresh():
-            self.schedule_gui_update(self.refresh_logs)
-        
-        self._search_timer = self.window.after(500, delayed_refresh)
+        self._cancel_pending_refresh()
+        self._pending_refresh_timer = self.window.after(delay_ms, self._do_pending_refresh)
+    
+    def _do_pending_refresh(self):
+        self._pending_refresh_timer = None
+        self.refresh_logs()
+    
+    def _cancel_pending_refresh(self):
+        if self._pending_refresh_timer:
+            self.window.after_cancel(self._pending_refresh_timer)
+            self._pending_refresh_timer = None
     
     def refresh_logs_safe(self):
         """Thread-safe refresh logs wrapper"""
@@ -702,13 +871,22 @@ class LogViewerWindow:
                 )
                 
                 if filename:
-                    logs = self.get_filtered_logs()
+                    # Export what the viewer is showing, in the order shown
+                    logs = [row[2] for row in self.log_tree.rows]
                     filepath = Path(filename)
                     
-                    # Use the log manager's export functionality
-                    self.log_manager.export_logs(filepath, logs)
+                    # Serialize and write in the background; report back on the GUI thread
+                    def export_in_background():
+                        try:
+                            self.log_manager.export_logs(filepath, logs)
+                            message = (messagebox.showinfo, "Export Complete", f"Exported {len(logs)} logs to {filename}")
+                        except Exception as e:
+                            message = (messagebox.showerror, "Export Error", f"Failed to export logs: {e}")
+                        
+                        if not self._destroyed and self.window and self.window.winfo_exists():
+                            self.window.after(0, lambda: message[0](message[1], message[2], parent=self.window))
                     
-                    messagebox.showinfo("Export Complete", f"Exported {len(logs)} logs to {filename}")
+                    threading.Thread(target=export_in_background, daemon=True, name="LogExport").start()
                     
             except Exception as e:
                 messagebox.showerror("Export Error", f"Failed to export logs: {e}")
@@ -724,7 +902,8 @@ class LogViewerWindow:
     
     def toggle_auto_refresh_safe(self):
         """Thread-safe auto-refresh toggle"""
-        if self.auto_refresh_var.get():
+        self._auto_refresh = self.auto_refresh_var.get()
+        if self._auto_refresh:
             self.start_auto_refresh()
             self.live_indicator.configure(text="● LIVE", foreground='green')
         else:
@@ -737,105 +916,141 @@ class LogViewerWindow:
         if self._destroyed or not self.window or not self.window.winfo_exists():
             return
         
+        # This refresh covers any debounced one still waiting
+        self._cancel_pending_refresh()
+        
         try:
-            # Store current selection for restoration if needed
-            current_selection = self.log_tree.selection()
-            current_focused = self.log_tree.focus()
-            
-            # Clear existing items
-            for item in self.log_tree.get_children():
-                self.log_tree.delete(item)
-            
-            # Get filtered logs (limit to prevent hanging)
+            # Get filtered logs (limit to prevent hanging), noting how far the log has got
+            sequence = self.log_manager.get_log_sequence()
             logs = self.get_filtered_logs()
             
+            # Entries logged while fetching may already be in logs (newest first); skip them when appending
+            self._last_sequence = sequence
+            self._refresh_overlap = {id(log) for log in logs[:self.log_manager.get_log_sequence() - sequence]}
+            
             # Update component filter options
             self.update_component_filter()
+            self._last_filter_sig = self.filter_signature()
             
-            # Add logs to tree (limit to prevent UI freeze)
-            max_display_logs = 1000  # Prevent UI freeze with too many logs
-            display_logs = logs[:max_display_logs]
-            
-            for log in display_logs:
-                self.add_log_entry_to_tree(log)
-            
-            # Apply default sort (newest first)
-            if hasattr(self.log_tree, 'sort_column') and self.log_tree.sort_column:
-                self.log_tree.sort_by_column(self.log_tree.sort_column)
+            # Hand the whole list to the tree; only the visible rows are rendered
+            self.log_tree.set_rows([self.build_log_row(log) for log in logs])
             
             # Focus on latest entry if enabled
-            if self.auto_focus_latest_var.get() and display_logs:
+            if self._auto_focus_latest and logs:
                 self.log_tree.focus_latest_entry()
-            elif self.auto_scroll_var.get() and display_logs:
+            elif self._auto_scroll and logs:
                 # Fallback to auto-scroll behavior
                 self.auto_scroll_to_latest()
             
             # Update status and statistics
-            self.update_status_display()
+            self.update_when_idle(self.update_status_display)
             self.update_statistics_display()
             
             # Update last log count and refresh time
             self.last_log_count = self.log_manager.get_log_count()
             self.last_refresh_time = time.time()
             
-            if len(logs) > max_display_logs:
-                self.status_var.set(f"Showing {max_display_logs} of {len(logs)} filtered logs (sorted by {self.log_tree.sort_column or 'Time'})")
-            
         except Exception as e:
             print(f"Error refreshing logs: {e}")
-            self.status_var.set(f"Error refreshing logs: {e}")
+            self.set_status(f"Error refreshing logs: {e}")
+    
+    def append_new_logs(self):
+        """Add entries logged since the last refresh that match the filters, without rebuilding (GUI thread only)"""
+        if self.filter_signature() != self._last_filter_sig:
+            # Rows on screen were built with other filters - rebuild instead of mixing, unless a
+            # debounced rebuild is already on its way (the user is still typing or picking filters)
+            if not self._pending_refresh_timer:
+                self.refresh_logs()
+            return
+        
+        entries, self._last_sequence = self.log_manager.get_logs_since(self._last_sequence)
+        overlap, self._refresh_overlap = self._refresh_overlap, set()
+        
+        matches = self.make_entry_filter()
+        matching = [entry for entry in entries if id(entry) not in overlap and matches(entry)]
+        if matching:
+            # One render for the whole batch; only the newest entry takes the focus
+            self.log_tree.add_rows([self.build_log_row(entry) for entry in matching],
+                                   focus_latest=self._auto_focus_latest,
+                                   max_rows=self.max_display_logs)
+            self.last_displayed_log_id = matching[-1].timestamp
+            
+            # Update status display
+            self.update_when_idle(self.update_status_display)
+        
+        self.last_log_count = self.log_manager.get_log_count()
+    
+    def filter_signature(self) -> tuple:
+        """Current level, component and search filter values"""
+        return self.level_var.get(), self.component_var.get(), self.search_var.get()
     
     def entry_matches_filters(self, entry: LogEntry) -> bool:
         """Check if a log entry matches current filters"""
         try:
-            # Level filter
-            level_filter = self.level_var.get()
-            if level_filter != "ALL" and entry.level != level_filter:
-                return False
-            
-            # Component filter
-            component_filter = self.component_var.get()
-            if component_filter != "ALL" and entry.component != component_filter:
-                return False
-            
-            # Search filter
-            search_term = self.search_var.get().lower()
-            if search_term:
-                if (search_term not in entry.message.lower() and 
-                    search_term not in entry.component.lower()):
-                    return False
-            
-            return True
+            return self.make_entry_filter()(entry)
         except Exception:
             return True  # Default to showing entry if filter check fails
     
-    def add_log_entry_to_tree(self, entry: LogEntry):
-        """Add a single log entry to the tree"""
-        try:
-            time_str = self.format_time(entry.timestamp)
-            message = self.truncate_message(entry.message, 100)
-            
-            # Determine row tag for coloring
-            tag = entry.level if entry.level in ['ERROR', 'CRITICAL', 'WARNING', 'DEBUG', 'INFO'] else ''
-            
-            self.log_tree.insert('', 'end', 
-                                values=(time_str, entry.level, entry.component, message),
-                                tags=(tag,))
-        except Exception as e:
-            print(f"Error adding log entry to tree: {e}")
+    def make_entry_filter(self) -> Callable[[LogEntry], bool]:
+        """Build a predicate for the current filters, reading the filter variables once"""
+        level_filter, component_filter, search_term = self.filter_signature()
+        want_level = level_filter != "ALL"
+        want_component = component_filter != "ALL"
+        search_term = search_term.lower()
+        searchable_text = self.searchable_text
+        
+        def matches(entry: LogEntry) -> bool:
+            if want_level and entry.level != level_filter:
+                return False
+            if want_component and entry.component != component_filter:
+                return False
+            return not search_term or search_term in searchable_text(entry)
+        
+        return matches
+    
+    def searchable_text(self, entry: LogEntry) -> str:
+        """Lowercased message and component, computed once per entry"""
+        cached = self._search_text_cache.get(id(entry))
+        if cached is not None and cached[0] is entry:
+            return cached[1]
+        
+        # ids can be reused once entries are gone, so the cache holds the entry and is pruned by size
+        if len(self._search_text_cache) > 2 * self.log_manager.max_memory_logs:
+            self._search_text_cache.clear()
+        text = f"{entry.message}\n{entry.component}".lower()
+        self._search_text_cache[id(entry)] = (entry, text)
+        return text
+    
+    def build_log_row(self, entry: LogEntry) -> tuple:
+        """Build the (values, tags, entry) row the log tree displays for an entry, once per entry"""
+        cached = self._row_cache.get(id(entry))
+        if cached is not None and cached[2] is entry:
+            return cached
+        
+        time_str = self.format_time(entry.timestamp)
+        message = self.truncate_message(entry.message, 100)
+        
+        # Determine row tag for coloring
+        tag = entry.level if entry.level in ['ERROR', 'CRITICAL', 'WARNING', 'DEBUG', 'INFO'] else ''
+        
+        # Same id-reuse guard as the search text cache: the row holds its entry
+        if len(self._row_cache) > 2 * self.log_manager.max_memory_logs:
+            self._row_cache.clear()
+        row = (time_str, entry.level, entry.component, message), (tag,), entry
+        self._row_cache[id(entry)] = row
+        return row
     
     def update_component_filter(self):
         """Update the component filter dropdown"""
         try:
-            # Get all components from recent logs (limit to prevent hanging)
-            recent_logs = self.log_manager.get_recent_logs(limit=500)
-            components = sorted(set(log.component for log in recent_logs if log.component))
-            
-            current_value = self.component_var.get()
-            self.component_combo['values'] = ["ALL"] + components
+            # Components are tracked by the log manager as entries come and go
+            values = ("ALL", *self.log_manager.get_components())
+            if values != self._component_values:
+                self._component_values = values
+                self.component_combo['values'] = values
             
             # Restore selection if it's still valid
-            if current_value not in self.component_combo['values']:
+            if self.component_var.get() not in values:
                 self.component_var.set("ALL")
         except Exception as e:
             print(f"Error updating component filter: {e}")
@@ -845,7 +1060,7 @@ class LogViewerWindow:
         try:
             # Get current log count and filter info
             total_logs = self.log_manager.get_log_count()
-            displayed_logs = len(self.log_tree.get_children())
+            displayed_logs = len(self.log_tree.rows)
             
             # Create status message
             status_parts = [f"Total: {total_logs:,}", f"Displayed: {displayed_logs:,}"]
@@ -869,20 +1084,39 @@ class LogViewerWindow:
             
             # Add auto-feature status
             auto_status = []
-            if self.auto_refresh_var.get():
+            if self._auto_refresh:
                 auto_status.append("Auto-refresh ON")
-            if self.auto_scroll_var.get():
+            if self._auto_scroll:
                 auto_status.append("Auto-scroll ON")
-            if self.auto_focus_latest_var.get():
+            if self._auto_focus_latest:
                 auto_status.append("Focus-latest ON")
             
             if auto_status:
                 status_parts.append(f"Auto: {', '.join(auto_status)}")
             
-            self.status_var.set(" | ".join(status_parts))
+            self.set_status(" | ".join(status_parts))
             
         except Exception as e:
-            self.status_var.set(f"Status update error: {e}")
+            self.set_status(f"Status update error: {e}")
+    
+    def update_when_idle(self, update_func: Callable):
+        """Run update_func once the event loop is idle, however often it is requested before then (GUI thread only)"""
+        if self._destroyed or update_func in self._idle_updates:
+            return
+        self._idle_updates.add(update_func)
+        
+        def run():
+            self._idle_updates.discard(update_func)
+            if not self._destroyed:
+                update_func()
+        
+        self.window.after_idle(run)
+    
+    def set_status(self, text: str):
+        """Update the status bar, skipping the Tk round-trip when the text is unchanged"""
+        if text != self._last_status:
+            self.status_var.set(text)
+            self._last_status = text
     
     def update_statistics_display(self):
         """Update the header statistics display"""
@@ -911,7 +1145,9 @@ class LogViewerWindow:
                 if time_since_refresh < 60:
                     stats_text += f" | Updated: {int(time_since_refresh)}s ago"
             
-            self.stats_label.configure(text=stats_text)
+            if stats_text != self._last_stats_text:
+                self.stats_label.configure(text=stats_text)
+                self._last_stats_text = stats_text
             
             # Update live indicator based on recent activity
             current_count = self.log_manager.get_log_count()
@@ -923,10 +1159,15 @@ class LogViewerWindow:
                 self.live_indicator.configure(foreground='gray')
                 
         except Exception as e:
+            self._last_stats_text = None
             self.stats_label.configure(text=f"Stats error: {e}")
     
     def format_time(self, timestamp: str) -> str:
         """Format timestamp for display with better formatting"""
+        # Our own ISO timestamps already carry the digits - slice instead of parsing
+        if len(timestamp) in (19, 26) and timestamp[10] == 'T':
+            return timestamp[11:19] + (timestamp[19:23] if len(timestamp) == 26 else ".000")
+        
         try:
             dt = datetime.fromisoformat(timestamp.replace('Z', '+00:00'))
             # Show more detailed time format with milliseconds
@@ -951,23 +1192,11 @@ class LogViewerWindow:
     def get_filtered_logs(self) -> List[LogEntry]:
         """Get logs with current filters applied"""
         try:
-            # Get recent logs with filters (limit to prevent hanging)
-            level_filter = self.level_var.get() if self.level_var.get() != "ALL" else None
-            component_filter = self.component_var.get() if self.component_var.get() != "ALL" else None
-            
-            logs = self.log_manager.get_recent_logs(
-                limit=2000,  # Increased but still limited
-                level_filter=level_filter,
-                component_filter=component_filter
-            )
-            
-            # Apply search filter
-            search_term = self.search_var.get().lower()
-            if search_term:
-                logs = [log for log in logs if search_term in log.message.lower() or 
-                       search_term in log.component.lower()]
-            
-            return logs
+            # One pass over the newest entries of the narrowest level/component index,
+            # stopping once the display limit is reached
+            level_filter, component_filter, _ = self.filter_signature()
+            return self.log_manager.filter_recent_logs(self.make_entry_filter(), self.max_display_logs,
+                                                       level_filter, component_filter)
         except Exception as e:
             print(f"Error getting filtered logs: {e}")
             return []
@@ -981,22 +1210,11 @@ class LogViewerWindow:
         if not selection:
             return
         
-        item = selection[0]
-        
         try:
-            # Get log entry details from tree values
-            values = self.log_tree.item(item)['values']
-            if len(values) >= 4:
-                time_str, level, component, message = values[:4]
-                
-                # Find matching log entry in recent logs
-                logs = self.get_filtered_logs()
-                for log in logs:
-                    if (log.level == level and 
-                        log.component == component and 
-                        message.replace("...", "") in log.message):
-                        self.show_log_detail_window(log)
-                        break
+            # Each row keeps the entry it was built from - no need to filter and search again
+            row = self.log_tree.selected_row()
+            if row:
+                self.show_log_detail_window(row[2])
         except Exception as e:
             messagebox.showerror("Error", f"Failed to show log details: {e}")
     
@@ -1032,11 +1250,19 @@ Message:
 {log_entry.message}
 """
             
+            remaining = ''
             if log_entry.details:
                 import json
-                details_text += f"\n\nAdditional Details:\n{'-' * 30}\n{json.dumps(log_entry.details, indent=2)}"
+                payload = json.dumps(log_entry.details, indent=2, default=str)
+                
+                # Large payloads are shown truncated; the rest is only rendered on request
+                if len(payload) > self.DETAIL_DISPLAY_LIMIT:
+                    payload, remaining = payload[:self.DETAIL_DISPLAY_LIMIT], payload[self.DETAIL_DISPLAY_LIMIT:]
+                details_text += f"\n\nAdditional Details:\n{'-' * 30}\n{payload}"
             
             text_widget.insert('1.0', details_text)
+            if remaining:
+                text_widget.insert(tk.END, f"\n... ({len(remaining):,} more characters)", 'truncated')
             text_widget.configure(state='disabled')
             
             # Button frame
@@ -1045,9 +1271,38 @@ Message:
             
             ttk.Button(button_frame, text="Close", command=detail_window.destroy).pack(side='right')
             
+            if remaining:
+                show_full_button = ttk.Button(button_frame, text="Show Full Details")
+                
+                def show_full():
+                    show_full_button.configure(state='disabled')
+                    text_widget.configure(state='normal')
+                    text_widget.delete('truncated.first', 'truncated.last')
+                    text_widget.configure(state='disabled')
+                    self._insert_in_chunks(text_widget, remaining)
+                
+                show_full_button.configure(command=show_full)
+                show_full_button.pack(side='right', padx=(0, 5))
+            
         except Exception as e:
             messagebox.showerror("Error", f"Failed to show log details: {e}")
     
+    def _insert_in_chunks(self, text_widget: tk.Text, text: str, start: int = 0):
+        """Append text to a read-only Text widget a chunk per idle callback so the window stays responsive"""
+        try:
+            if not text_widget.winfo_exists():
+                return
+            
+            end = start + self.DETAIL_CHUNK_SIZE
+            text_widget.configure(state='normal')
+            text_widget.insert(tk.END, text[start:end])
+            text_widget.configure(state='disabled')
+            
+            if end < len(text):
+                text_widget.after_idle(self._insert_in_chunks, text_widget, text, end)
+        except Exception as e:
+            print(f"Error showing full log details: {e}")
+    
     def start_auto_refresh(self):
         """Start auto-refresh timer with enhanced functionality and latest focus"""
         def auto_refresh():
@@ -1055,30 +1310,28 @@ Message:
                 return
             
             try:
-                # Check if there are new logs and auto-refresh is enabled
-                current_count = self.log_manager.get_log_count()
-                if self.auto_refresh_var.get():
-                    # Always refresh if enabled, but at different rates based on activity
-                    if current_count != self.last_log_count:
-                        # New logs detected - refresh and focus on latest
-                        def refresh_and_focus():
-                            self.refresh_logs()
-                            # Ensure latest entry is focused after refresh
-                            if self.auto_focus_latest_var.get():
-                                self.log_tree.focus_latest_entry()
-                        
-                        self.schedule_gui_update(refresh_and_focus)
-                    else:
-                        # No new logs - just update statistics
-                        self.schedule_gui_update(self.update_statistics_display)
-                
-                # Schedule next refresh with adaptive interval
-                next_interval = self.refresh_interval
-                if current_count != self.last_log_count:
-                    # More frequent updates when activity is high
-                    next_interval = min(self.refresh_interval, 1000)
+                if not self.window.winfo_viewable():
+                    # Hidden or minimized - nothing to draw; new logs are picked up once it is shown again
+                    has_new_logs = False
+                    next_interval = self.HIDDEN_REFRESH_INTERVAL if self.window.state() == 'iconic' else self.refresh_interval
+                else:
+                    # Check if there are new logs and auto-refresh is enabled
+                    has_new_logs = self.log_manager.get_log_sequence() != self._last_sequence
+                    if self._auto_refresh:
+                        if has_new_logs:
+                            # New logs detected - append just those (focuses the latest if enabled)
+                            self.schedule_gui_update(self.append_new_logs)
+                        else:
+                            # No new logs - just update statistics
+                            self.schedule_gui_update(self.update_statistics_display)
+                    
+                    # Schedule next refresh with adaptive interval
+                    next_interval = self.refresh_interval
+                    if has_new_logs:
+                        # More frequent updates when activity is high
+                        next_interval = min(self.refresh_interval, 1000)
                 
-                if self.auto_refresh_var.get() and not self._destroyed:
+                if self._auto_refresh and not self._destroyed:
                     self._refresh_timer = self.window.after(next_interval, auto_refresh)
                     
             except Exception as e:
@@ -1100,7 +1353,7 @@ Message:
             try:
                 self.log_manager.test_logging()
                 # After generating test logs, focus on latest if enabled
-                if self.auto_focus_latest_var.get():
+                if self._auto_focus_latest:
                     self.schedule_gui_update(self.log_tree.focus_latest_entry)
             except Exception as e:
                 print(f"Error generating test logs: {e}")
@@ -1119,13 +1372,12 @@ Message:
                     for j, level in enumerate(levels):
                         message = f"Test {level.value} message from {component} component (Enhanced viewer with latest focus)"
                         details = {"test_number": i * len(levels) + j, "component": component, "level": level.value, "viewer": "enhanced_with_focus"}
+                        # Bursts are fine: records queue to the background writer and reach the
+                        # viewer as batches, so no pacing is needed between them
                         self.log_manager.log(level, component, message, details)
-                        
-                        # Small delay to prevent overwhelming the system
-                        time.sleep(0.01)
                 
                 # Focus on latest after generating all test logs
-                if self.auto_focus_latest_var.get():
+                if self._auto_focus_latest:
                     self.schedule_gui_update(self.log_tree.focus_latest_entry)
                         
             except Exception as e:
@@ -1220,6 +1472,8 @@ class LogStatsWindow:
         self.log_manager = log_manager
         self.window = None
         self._destroyed = False
+        self._displayed_text = None
+        self._report_key = None  # Log sequence and settings the displayed report was built from
         
         self.create_window()
         self.create_widgets()
@@ -1306,6 +1560,14 @@ class LogStatsWindow:
         if self._destroyed:
             return
         
+        # Nothing logged or cleared and no settings changed since the last report - it would come out the same.
+        # clear_logs leaves the sequence alone, so the entry count is part of the key.
+        manager = self.log_manager
+        report_key = (manager.get_log_sequence(), manager.get_log_count(),
+                      manager.log_level, manager.debug_mode, manager.console_logging)
+        if report_key == self._report_key:
+            return
+        
         def update_in_background():
             """Update stats in background thread"""
             try:
@@ -1317,9 +1579,11 @@ class LogStatsWindow:
                 else:
                     stats_text = self.generate_enhanced_stats(stats, logs)
                 
-                # Schedule GUI update
+                # Schedule GUI update - leave the widget (and its scroll position) alone if nothing changed
                 def update_display():
-                    if not self._destroyed:
+                    self._report_key = report_key
+                    if not self._destroyed and stats_text != self._displayed_text:
+                        self._displayed_text = stats_text
                         self.stats_text.delete('1.0', tk.END)
                         self.stats_text.insert('1.0', stats_text)
                 
@@ -1330,6 +1594,8 @@ class LogStatsWindow:
                 error_text = f"Error generating enhanced statistics: {e}"
                 def show_error():
                     if not self._destroyed:
+                        self._report_key = None
+                        self._displayed_text = error_text
                         self.stats_text.delete('1.0', tk.END)
                         self.stats_text.insert('1.0', error_text)
                 
@@ -1347,13 +1613,8 @@ class LogStatsWindow:
         if logs:
             oldest = logs[-1].timestamp
             newest = logs[0].timestamp
-            try:
-                oldest_dt = datetime.fromisoformat(oldest.replace('Z', '+00:00'))
-                newest_dt = datetime.fromisoformat(newest.replace('Z', '+00:00'))
-                duration = newest_dt - oldest_dt
-                duration_str = str(duration).split('.')[0]
-            except:
-                duration_str = "Unknown"
+            duration = timedelta(seconds=logs[0].created - logs[-1].created)
+            duration_str = str(duration).split('.')[0]
         else:
             oldest = newest = duration_str = "N/A"
         
@@ -1361,9 +1622,14 @@ class LogStatsWindow:
         by_level = stats.get('by_level', {})
         by_component = stats.get('by_component', {})
         
-        # Error analysis
-        error_logs = [log for log in logs if log.level in ['ERROR', 'CRITICAL']]
-        warning_logs = [log for log in logs if log.level == 'WARNING']
+        # Error analysis - one pass over the entries
+        error_logs = []
+        warning_count = 0
+        for log in logs:
+            if log.level in ERROR_LEVELS:
+                error_logs.append(log)
+            elif log.level == 'WARNING':
+                warning_count += 1
         
         # Generate comprehensive report
         report = f"""Enhanced Log Statistics & Analysis Report with Latest Focus
@@ -1414,9 +1680,9 @@ Level Distribution:
         # Enhanced error analysis
         report += f"\nError Analysis:\n{'-' * 30}\n"
         report += f"  Total Errors: {len(error_logs):,}\n"
-        report += f"  Total Warnings: {len(warning_logs):,}\n"
+        report += f"  Total Warnings: {warning_count:,}\n"
         report += f"  Error Rate: {(len(error_logs) / total_logs * 100):.2f}%\n"
-        report += f"  Warning Rate: {(len(warning_logs) / total_logs * 100):.2f}%\n"
+        report += f"  Warning Rate: {(warning_count / total_logs * 100):.2f}%\n"
         
         if error_logs:
             report += f"\nRecent Errors (Last 5):\n{'-' * 25}\n"
@@ -1426,7 +1692,7 @@ Level Distribution:
         
         # System health assessment
         error_rate = len(error_logs) / total_logs * 100 if total_logs > 0 else 0
-        warning_rate = len(warning_logs) / total_logs * 100 if total_logs > 0 else 0
+        warning_rate = warning_count / total_logs * 100 if total_logs > 0 else 0
         
         if error_rate == 0 and warning_rate < 5:
             health = "Excellent ✓"
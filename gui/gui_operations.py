@@ -15,7 +15,7 @@ from pathlib import Path
 from enum import Enum
 import logging
 
-from gui_logging import LogManager, LogLevel, PerformanceLogger
+from gui_logging import LogManager, LogLevel
 
 class OperationState(Enum):
     IDLE = "idle"
@@ -109,7 +109,7 @@ class OperationManager:
             full_command = [sys.executable, 'filemaker_extract_refactored.py'] + cmd_args
             self.log_manager.log(LogLevel.DEBUG, "Command", f"Executing: {' '.join(full_command)}")
             
-            with PerformanceLogger(self.log_manager, "Command", description):
+            with self.log_manager.performance_logger("Command", description):
                 # Use shorter timeout for connection tests
                 actual_timeout = min(timeout, 60) if 'info-only' in cmd_args or 'migration-status' in cmd_args else timeout
                 